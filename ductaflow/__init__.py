@@ -7,7 +7,11 @@ A simple, powerful framework for reproducible data pipelines using notebooks.
 from .ductaflow import (
     # Core execution functions
     run_notebook,
+    run_notebook_async,
+    run_notebook_session,
+    run_notebooks_parallel,
     run_step_flow,
+    run_step_flows,
     debug_flow,
 
 
@@ -22,11 +26,14 @@ from .ductaflow import (
 
     # HTML export
     convert_notebook_to_html,
+    convert_notebook_to_html_async,
+    wait_for_html_exports,
 
     # Utilities
     load_cli_config,
     is_notebook_execution,
     setup_execution_logging,
+    teardown_execution_logging,
     setup_conductor_logging,
 )
 
@@ -37,7 +44,11 @@ __description__ = "The pipeline framework that actually works in practice"
 # Make key functions easily accessible
 __all__ = [
     'run_notebook',
+    'run_notebook_async',
+    'run_notebook_session',
+    'run_notebooks_parallel',
     'run_step_flow',
+    'run_step_flows',
     'debug_flow',
     'display_config_summary',
     'generate_config_markdown',
@@ -45,8 +56,11 @@ __all__ = [
     'analyze_execution_logs',
     'generate_status_report',
     'convert_notebook_to_html',
+    'convert_notebook_to_html_async',
+    'wait_for_html_exports',
     'load_cli_config',
     'is_notebook_execution',
     'setup_execution_logging',
+    'teardown_execution_logging',
     'setup_conductor_logging',
 ]
@@ -3,19 +3,32 @@
 
 
 # %%
+import argparse
 import json
-import subprocess
+import functools
+import dataclasses
+import enum
+import hashlib
+import math
 from pathlib import Path
 from datetime import datetime
 import shutil
-import pandas as pd
+import string
 import os
-import jupytext
 import logging
+import logging.handlers
 import re
 import sys
 import io
-from typing import Dict, Any, Optional, Union
+import mmap
+import queue
+import time
+import asyncio
+import atexit
+import contextlib
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 
 # %%
 def setup_console_encoding():
@@ -42,11 +55,18 @@ def setup_console_encoding():
 setup_console_encoding()
 
 # %%
+def _require_papermill():
+    """Import papermill on first use - it (and jupytext) are only needed to execute flows"""
+    try:
+        import papermill
+    except ImportError:
+        raise ImportError("papermill is required for notebook execution. Install with: pip install papermill") from None
+    return papermill
+
 try:
-    import papermill as pm
+    import orjson  # Optional: faster JSON for config persistence
 except ImportError:
-    print("Warning: papermill not installed. Install with: pip install papermill")
-    pm = None
+    orjson = None
 
 # %% [markdown]
 # ## Simple Logging Approach
@@ -86,11 +106,57 @@ except ImportError:
 # %% [markdown]
 # ## Utility Functions
 
+# %%
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that doesn't flush after every record.
+    
+    Routine records reach disk in buffer-sized blocks; warnings and errors are
+    flushed immediately so failure diagnostics are never left in memory.
+    Anything still buffered is written on close().
+    """
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class _ConsoleHandler(logging.StreamHandler):
+    """
+    StreamHandler that always writes to the current sys.stderr.
+    
+    One instance is shared by every execution logger, so it must follow stderr
+    redirection (Jupyter, pytest capture) rather than binding the stream once.
+    """
+    def __init__(self):
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+# Console handler - simple format (no level names = no pink); shared by all executions
+_console_handler = _ConsoleHandler()
+_console_handler.setFormatter(logging.Formatter('%(message)s'))
+
+# Detailed formatter for log files (with timestamps, levels, etc.)
+_file_formatter = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
 # %%
 def setup_execution_logging(log_file_path: Union[str, Path], 
                           logger_name: str = "ductaflow",
                           level: int = logging.INFO,
-                          propagate: bool = False) -> logging.Logger:
+                          propagate: bool = False,
+                          registered: bool = True) -> logging.Logger:
     """
     Set up logging for THIS execution.
     Logs go to file AND console. By default, logs don't propagate to parent executions.
@@ -100,6 +166,9 @@ def setup_execution_logging(log_file_path: Union[str, Path],
         logger_name: Name for the logger (default: "ductaflow")
         level: Logging level (default: INFO)
         propagate: If True, logs also propagate to parent loggers (default: False)
+        registered: If False, create a standalone logger that is not kept in logging's
+                    registry (for one-off per-run names; it is freed once unused, but
+                    can't be looked up with logging.getLogger and never propagates)
         
     Returns:
         Configured logger instance
@@ -118,41 +187,72 @@ def setup_execution_logging(log_file_path: Union[str, Path],
         )
         logger2.info("HELLO CALLER - Flow started")  # Shows in parent console too
     """
-    import logging
-    from pathlib import Path
-    
     log_file_path = Path(log_file_path)
     log_file_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Create a logger for THIS execution (not root)
-    logger = logging.getLogger(logger_name)
+    logger = logging.getLogger(logger_name) if registered else logging.Logger(logger_name)
     logger.setLevel(level)
-    logger.handlers.clear()
+    teardown_execution_logging(logger)  # Release any previous setup of this logger
     logger.propagate = propagate  # Allow optional propagation
     
-    # Simple formatter - just message for console (no level names = no pink)
-    console_formatter = logging.Formatter('%(message)s')
-    
-    # Detailed formatter for file (with timestamps, levels, etc.)
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # File handler - detailed format
-    file_handler = logging.FileHandler(log_file_path, mode='w', encoding='utf-8')
+    # File handler - detailed format (buffered, flushed on warnings/errors and close)
+    # Only this is per execution; the console handler is shared, so the level is
+    # enforced on the queue handler below (this also covers propagated records)
+    file_handler = _BufferedFileHandler(log_file_path, mode='w', encoding='utf-8')
     file_handler.setLevel(level)
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
-    
-    # Console handler - simple format (no level names = no pink)
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    file_handler.setFormatter(_file_formatter)
+    
+    # The logging thread only enqueues records; a listener thread does the file/console I/O
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, _console_handler,
+                                              respect_handler_level=True)
+    listener.start()
+    _log_listeners.add(listener)
+    logger._ductaflow_listener = listener
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(level)
+    logger.addHandler(queue_handler)
     
     return logger
 
+def teardown_execution_logging(logger: logging.Logger) -> None:
+    """
+    Drain and close the handlers set up by setup_execution_logging.
+    
+    Writes out any queued records, then closes the log file (releasing the file
+    lock - important on Windows before deleting execution directories).
+    
+    Args:
+        logger: Logger returned by setup_execution_logging
+    """
+    listener = getattr(logger, '_ductaflow_listener', None)
+    if listener is not None:
+        del logger._ductaflow_listener
+        _log_listeners.discard(listener)
+        listener.stop()  # Processes everything already queued before returning
+        _close_listener_handlers(listener)
+    
+    for handler in logger.handlers[:]:
+        handler.close()
+        logger.removeHandler(handler)
+
+# Listeners still running at exit are drained so no queued records are lost
+_log_listeners = set()
+
+@atexit.register
+def _stop_log_listeners() -> None:
+    for listener in list(_log_listeners):
+        listener.stop()
+        _close_listener_handlers(listener)
+    _log_listeners.clear()
+
+def _close_listener_handlers(listener: logging.handlers.QueueListener) -> None:
+    """Close a listener's per-execution handlers, leaving the shared console handler open"""
+    for handler in listener.handlers:
+        if handler is not _console_handler:
+            handler.close()
+
 # %%
 def _save_conductor_checkpoint(notebook_path: Optional[Union[str, Path]] = None,
                                session_outputs_dir: Union[str, Path] = "session_outputs",
@@ -197,6 +297,7 @@ def _save_conductor_checkpoint(notebook_path: Optional[Union[str, Path]] = None,
         session_outputs_dir.mkdir(parents=True, exist_ok=True)
         
         # Convert .py to .ipynb and save
+        import jupytext
         nb = jupytext.read(notebook_path)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         base_name = notebook_path.stem
@@ -257,6 +358,61 @@ def setup_conductor_logging(session_outputs_dir: Union[str, Path] = "session_out
     return logger
 
 # %%
+@functools.lru_cache(maxsize=4096)
+def _camel_to_snake(key: str) -> str:
+    """Convert camelCase to snake_case (memoized - config keys repeat across flows and runs)"""
+    # Single pass equivalent of the two classic substitutions
+    #   re.sub('(.)([A-Z][a-z]+)', r'\1_\2', key) then re.sub('([a-z0-9])([A-Z])', r'\1_\2', ...)
+    # An underscore goes before an uppercase letter that starts a capitalised word
+    # (and doesn't start the key or a line), or that follows a lowercase letter or digit
+    chars = []
+    last = len(key) - 1
+    for i, char in enumerate(key):
+        if 'A' <= char <= 'Z' and i > 0:
+            prev = key[i - 1]
+            if ('a' <= prev <= 'z' or '0' <= prev <= '9'
+                    or (prev != '\n' and i < last and 'a' <= key[i + 1] <= 'z')):
+                chars.append('_')
+        chars.append(char)
+    return ''.join(chars).lower()
+
+def _convert_config_value(value):
+    """Convert value to Python-compatible format"""
+    if isinstance(value, bool):
+        return 'True' if value else 'False'
+    elif isinstance(value, str):
+        return repr(value)  # Properly escape strings
+    elif isinstance(value, (int, float)):
+        return str(value)
+    elif isinstance(value, dict):
+        return {_camel_to_snake(k): _convert_config_value(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_convert_config_value(item) for item in value]
+    else:
+        return repr(value)
+
+def _write_python_dict(buffer: io.StringIO, d: Dict[str, Any], indent: int = 0) -> None:
+    """Write dictionary as Python code, converting keys and values on the way"""
+    buffer.write("{\n")
+    item_prefix = "  " + "  " * indent
+    keys = [_camel_to_snake(k) for k in d]
+    if len(set(keys)) == len(keys):
+        items = zip(keys, d.values())
+    else:
+        # camelCase/snake_case duplicates - re-key so they collapse exactly as a dict would
+        items = dict(zip(keys, d.values())).items()
+    for i, (k, v) in enumerate(items):
+        if i:
+            buffer.write(",\n")
+        buffer.write(f'{item_prefix}"{k}": ')
+        if isinstance(v, dict):
+            _write_python_dict(buffer, v, indent + 1)
+        elif isinstance(v, list):
+            buffer.write("[" + ", ".join(str(_convert_config_value(item)) for item in v) + "]")
+        else:
+            buffer.write(_convert_config_value(v))
+    buffer.write("\n" + "  " * indent + "}")
+
 def _convert_config_to_python(config: Dict[str, Any]) -> str:
     """
     Convert a config dictionary to Python-compatible string format.
@@ -268,59 +424,130 @@ def _convert_config_to_python(config: Dict[str, Any]) -> str:
     Returns:
         Python-compatible string representation
     """
-    def convert_key(key: str) -> str:
-        """Convert camelCase to snake_case"""
-        # Insert an underscore before any uppercase letter that follows a lowercase letter
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', key)
-        # Insert an underscore before any uppercase letter that follows a lowercase letter or number
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
-    
-    def convert_value(value):
-        """Convert value to Python-compatible format"""
-        if isinstance(value, bool):
-            return 'True' if value else 'False'
-        elif isinstance(value, str):
-            return repr(value)  # Properly escape strings
-        elif isinstance(value, (int, float)):
-            return str(value)
+    # Convert and format in a single walk, straight into one buffer
+    buffer = io.StringIO()
+    _write_python_dict(buffer, config)
+    return buffer.getvalue()
+
+# %%
+def _needs_stdlib_json(obj: Any) -> bool:
+    """
+    True if orjson would encode obj differently from json.dump(default=str).
+    
+    orjson writes NaN/±Infinity as null, stringifies float and tuple subclasses
+    (e.g. namedtuples), only takes str keys, and natively encodes Enums and
+    dataclasses that the stdlib would pass to str() - any payload holding those
+    goes through the stdlib.
+    """
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if type(value) is float:
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, (float, enum.Enum)):
+            return True
+        elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return True
         elif isinstance(value, dict):
-            converted_dict = {convert_key(k): convert_value(v) for k, v in value.items()}
-            return converted_dict
+            if any(type(key) is not str for key in value):
+                return True
+            stack.extend(value.values())
         elif isinstance(value, list):
-            return [convert_value(item) for item in value]
-        else:
-            return repr(value)
-    
-    # Convert the entire config
-    converted_config = {convert_key(k): convert_value(v) for k, v in config.items()}
-    
-    # Format as Python dictionary with proper formatting
-    def format_python_dict(d, indent=0):
-        """Format dictionary as Python code"""
-        if not isinstance(d, dict):
-            return str(d)
-        
-        lines = ["{"]
-        items = []
-        for k, v in d.items():
-            if isinstance(v, dict):
-                v_str = format_python_dict(v, indent + 1)
-            elif isinstance(v, list):
-                v_str = "[" + ", ".join(str(item) for item in v) + "]"
-            else:
-                v_str = str(v)
-            items.append(f'  {"  " * indent}"{k}": {v_str}')
-        
-        lines.append(",\n".join(items))
-        lines.append("  " * indent + "}")
-        return "\n".join(lines)
+            stack.extend(value)
+        elif isinstance(value, tuple):
+            if type(value) is not tuple:
+                return True
+            stack.extend(value)
+    return False
+
+def _dump_json(obj: Any, path: Union[str, Path]) -> None:
+    """
+    Write obj to path as indented JSON, using orjson when it is installed.
+    
+    Non-JSON values (Paths, datetimes etc.) are written via str(), matching
+    json.dump(default=str); the saved values never depend on orjson being present.
+    """
+    if orjson is not None and not _needs_stdlib_json(obj):
+        try:
+            Path(path).write_bytes(orjson.dumps(
+                obj,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME,
+                default=str
+            ))
+            return
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits - let the stdlib encoder handle it
+            pass
     
-    return format_python_dict(converted_config)
+    with open(path, 'w') as f:
+        json.dump(obj, f, indent=2, default=str)
+
+def _load_json(path: Union[str, Path]) -> Any:
+    """
+    Read a JSON file in one go and parse it, using orjson when it is installed.
+    
+    Falls back to the stdlib parser for input orjson rejects but json accepts (e.g. NaN).
+    """
+    return _loads_json(Path(path).read_bytes())
+
+def _loads_json(raw: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+def _format_json(obj: Any) -> str:
+    """Indented JSON text for display, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
 
 # %% [markdown]
 # ## Configuration Display Functions
 
 # %%
+# Header rows shared by every config table
+_CONFIG_TABLE_HEADER = ("| Parameter | Value |", "|-----------|-------|")
+
+def _format_text_cell(value: Any) -> str:
+    """Escape pipes and limit length for table display."""
+    display_value = str(value).replace("|", "\\|")
+    if len(display_value) > 50:
+        display_value = display_value[:47] + "..."
+    return display_value
+
+def _format_sequence_cell(value) -> str:
+    return ", ".join(str(v) for v in value)
+
+# Type dispatch for config table cells, looked up along the value's MRO so subclasses
+# (namedtuples, IntEnums, ...) format like their base; anything else is escaped text
+_CELL_FORMATTERS = {
+    bool: lambda value: "✓" if value else "✗",
+    int: str,
+    float: str,
+    list: _format_sequence_cell,
+    tuple: _format_sequence_cell,
+    type(None): lambda value: "*None*",
+    dict: lambda value: f"*{len(value)} items*",
+}
+
+@functools.lru_cache(maxsize=128)
+def _cell_formatter(value_type: type):
+    """Formatter for the nearest class in value_type's MRO (bool is found before int)."""
+    for klass in value_type.__mro__:
+        formatter = _CELL_FORMATTERS.get(klass)
+        if formatter is not None:
+            return formatter
+    return _format_text_cell
+
+def _format_cell(value: Any) -> str:
+    """Format a config value for display in a markdown table cell."""
+    return _cell_formatter(type(value))(value)
+
 def generate_config_markdown(config: Dict[str, Any], flow_name: str = None) -> str:
     """
     Generate markdown representation of configuration dictionary.
@@ -347,33 +574,16 @@ def generate_config_markdown(config: Dict[str, Any], flow_name: str = None) -> s
     nested_items = {}
     
     for key, value in config.items():
-        if isinstance(value, dict) and value:  # Non-empty dict
+        if type(value) is dict and value:  # Non-empty dict
             nested_items[key] = value
         else:
             flat_items[key] = value
     
     # Display flat items as table if any exist
     if flat_items:
-        markdown_lines.append("| Parameter | Value |")
-        markdown_lines.append("|-----------|-------|")
-        
-        for key, value in flat_items.items():
-            # Format value for display
-            if isinstance(value, (list, tuple)):
-                display_value = ", ".join(str(v) for v in value)
-            elif isinstance(value, bool):
-                display_value = "✓" if value else "✗"
-            elif value is None:
-                display_value = "*None*"
-            elif isinstance(value, (int, float)):
-                display_value = str(value)
-            else:
-                # Escape pipes and limit length for table display
-                display_value = str(value).replace("|", "\\|")
-                if len(display_value) > 50:
-                    display_value = display_value[:47] + "..."
-            
-            markdown_lines.append(f"| {key} | {display_value} |")
+        markdown_lines.extend(_CONFIG_TABLE_HEADER)
+        
+        markdown_lines.extend([f"| {key} | {_format_cell(value)} |" for key, value in flat_items.items()])
         
         markdown_lines.append("")  # Empty line after table
     
@@ -383,28 +593,9 @@ def generate_config_markdown(config: Dict[str, Any], flow_name: str = None) -> s
         markdown_lines.append("")
         
         if isinstance(section_value, dict):
-            markdown_lines.append("| Parameter | Value |")
-            markdown_lines.append("|-----------|-------|")
+            markdown_lines.extend(_CONFIG_TABLE_HEADER)
             
-            for key, value in section_value.items():
-                # Format value for display
-                if isinstance(value, (list, tuple)):
-                    display_value = ", ".join(str(v) for v in value)
-                elif isinstance(value, bool):
-                    display_value = "✓" if value else "✗"
-                elif value is None:
-                    display_value = "*None*"
-                elif isinstance(value, dict):
-                    display_value = f"*{len(value)} items*"
-                elif isinstance(value, (int, float)):
-                    display_value = str(value)
-                else:
-                    # Escape pipes and limit length for table display
-                    display_value = str(value).replace("|", "\\|")
-                    if len(display_value) > 50:
-                        display_value = display_value[:47] + "..."
-                
-                markdown_lines.append(f"| {key} | {display_value} |")
+            markdown_lines.extend([f"| {key} | {_format_cell(value)} |" for key, value in section_value.items()])
         else:
             # Handle non-dict nested values
             markdown_lines.append(f"```")
@@ -445,6 +636,28 @@ def display_config_summary(config: Dict[str, Any], flow_name: str = None):
 # ## HTML Export Functions
 
 # %%
+_html_export_executor: Optional[ThreadPoolExecutor] = None
+_html_export_lock = threading.Lock()
+_pending_html_exports = set()
+# Per-thread {template: HTMLExporter}; dropped with the thread, so nothing accumulates
+_html_exporters = threading.local()
+
+_HTML_WRITE_CHUNK_CHARS = 1 << 20  # 1M characters per write
+
+def _get_html_exporter(template: str):
+    """Build (once per template and thread) the nbconvert HTMLExporter used for HTML export."""
+    exporters = getattr(_html_exporters, 'by_template', None)
+    if exporters is None:
+        exporters = _html_exporters.by_template = {}
+    exporter = exporters.get(template)
+    if exporter is None:
+        try:
+            from nbconvert import HTMLExporter
+        except ImportError as e:
+            raise ImportError("nbconvert is required for HTML export. Install with: pip install nbconvert") from e
+        exporter = exporters[template] = HTMLExporter(template_name=template)
+    return exporter
+
 def convert_notebook_to_html(notebook_path: Union[str, Path], 
                            html_path: Union[str, Path],
                            template: str = 'lab') -> None:
@@ -456,25 +669,21 @@ def convert_notebook_to_html(notebook_path: Union[str, Path],
         html_path: Path where HTML file should be saved
         template: nbconvert template to use ('classic', 'lab', 'reveal', etc.)
                   Defaults to 'lab' which requires jupyterlab but can use classic if issues)
+    
+    Raises:
+        ImportError: If nbconvert is not installed
+        RuntimeError: If the conversion itself fails
     """
     try:
-        import nbconvert
-        from nbconvert import HTMLExporter
-        
-        exporter = HTMLExporter(template_name=template)
+        exporter = _get_html_exporter(template)
         (body, resources) = exporter.from_filename(str(notebook_path))
-        
+        # Encode and write in slices so a large report never exists twice (as str and bytes)
         with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(body)
+            for start in range(0, len(body), _HTML_WRITE_CHUNK_CHARS):
+                f.write(body[start:start + _HTML_WRITE_CHUNK_CHARS])
             
     except ImportError:
-        # Fallback to command line nbconvert if library import fails
-        subprocess.run([
-            'jupyter', 'nbconvert', '--to', 'html', 
-            '--template', template,
-            '--output', str(html_path),
-            str(notebook_path)
-        ], check=True, capture_output=True)
+        raise
     except Exception as e:
         error_msg = str(e).lower()
         # Check if it's a template-related error
@@ -490,27 +699,96 @@ def convert_notebook_to_html(notebook_path: Union[str, Path],
 
 
 
+def _html_executor() -> ThreadPoolExecutor:
+    """Lazily create the shared thread pool used for background HTML export."""
+    global _html_export_executor
+    with _html_export_lock:
+        if _html_export_executor is None:
+            _html_export_executor = ThreadPoolExecutor(max_workers=os.cpu_count(),
+                                                       thread_name_prefix="ductaflow-html")
+            atexit.register(wait_for_html_exports)
+    return _html_export_executor
+
+def convert_notebook_to_html_async(notebook_path: Union[str, Path], 
+                                   html_path: Union[str, Path],
+                                   template: str = 'lab') -> Future:
+    """
+    Convert executed notebook to HTML on a background thread.
+    
+    Same as convert_notebook_to_html, but returns immediately with a Future.
+    Paths are resolved up front so later working directory changes don't matter.
+    Outstanding exports are waited on at interpreter exit (or via wait_for_html_exports).
+    
+    Args:
+        notebook_path: Path to the executed .ipynb notebook
+        html_path: Path where HTML file should be saved
+        template: nbconvert template to use (see convert_notebook_to_html)
+        
+    Returns:
+        Future that resolves to None, or raises the conversion error
+    """
+    future = _html_executor().submit(convert_notebook_to_html,
+                                     Path(notebook_path).resolve(),
+                                     Path(html_path).resolve(),
+                                     template)
+    _pending_html_exports.add(future)
+    future.add_done_callback(_pending_html_exports.discard)
+    return future
+
+def wait_for_html_exports() -> None:
+    """Block until all HTML exports started with convert_notebook_to_html_async have finished."""
+    wait(list(_pending_html_exports))
+
+def _report_html_export(html_path: Path, future: Future) -> None:
+    """Done-callback for run_notebook's background HTML export."""
+    error = future.exception()
+    if error is None:
+        print(f"✓ HTML export created: {html_path}")
+    else:
+        print(f"⚠️ HTML export failed: {error}")
+
+def _export_notebook_html(output_notebook: Path, export_html: Union[bool, str]) -> None:
+    """
+    HTML export for run_notebook - synchronous unless export_html == "background".
+    
+    Background exports are only safe in a process that outlives them (e.g. a script
+    that calls wait_for_html_exports); a kernel that is shut down after the cell
+    finishes would lose them, so the blocking export is the default.
+    """
+    html_output = output_notebook.with_suffix('.html')
+    if export_html == "background":
+        future = convert_notebook_to_html_async(output_notebook, html_output)
+        future.add_done_callback(functools.partial(_report_html_export, html_output))
+        return
+    try:
+        convert_notebook_to_html(output_notebook, html_output)
+        print(f"✓ HTML export created: {html_output}")
+    except Exception as e:
+        print(f"⚠️ HTML export failed: {e}")
+
+
 # %% [markdown]
 # ## CLI Helper Function
 
 # %%
+@functools.lru_cache(maxsize=None)
 def is_notebook_execution() -> bool:
     """
     Check if we're in notebook/papermill execution vs CLI.
     
+    The answer is fixed for the life of the process, so it is computed once.
+    
     Returns:
         True if notebook/papermill execution, False if CLI
     """
-    import sys
-    
     # Method 1: Check for IPython/Jupyter environment (most reliable)
-    try:
+    # A running kernel has always imported IPython already - if it hasn't been
+    # imported there is no shell to find, so skip the (slow) import entirely
+    if 'IPython' in sys.modules:
         # This will exist in both interactive notebooks and papermill execution
         from IPython import get_ipython
         if get_ipython() is not None:
             return True
-    except ImportError:
-        pass
     
     # Method 2: Check for CLI arguments (fallback)
     # If we have CLI args like --config, we're definitely in CLI mode
@@ -527,6 +805,9 @@ def load_cli_config(default_config_path: str, description: str = 'Run ductaflow
     Parses --config and --output-dir arguments, loads JSON config file, and optionally 
     changes to execution directory to match ductaflow behavior.
     
+    Orchestrators can hand the config over without a file using --config-stdin
+    (JSON on stdin) or --config-env VAR (JSON in environment variable VAR).
+    
     Args:
         default_config_path: Default path to config file if --config not provided
         description: Description for the argument parser
@@ -534,40 +815,53 @@ def load_cli_config(default_config_path: str, description: str = 'Run ductaflow
     Returns:
         Dictionary containing loaded configuration
     """
-    import argparse
-    import json
-    import os
-    import sys
-    from pathlib import Path
-    
     parser = argparse.ArgumentParser(description=description)
-    parser.add_argument('--config', type=str, default=default_config_path,
+    # One config source per run - a file, stdin or an environment variable
+    config_source_group = parser.add_mutually_exclusive_group()
+    config_source_group.add_argument('--config', type=str, default=default_config_path,
                        help=f'Path to JSON config file (default: {default_config_path})')
+    config_source_group.add_argument('--config-stdin', action='store_true',
+                       help='Read the JSON config from stdin instead of --config')
+    config_source_group.add_argument('--config-env', type=str, default=None, metavar='VAR',
+                       help='Read the JSON config from environment variable VAR instead of --config')
     parser.add_argument('--output-dir', type=str, default=None,
                        help='Output directory to execute in (matches ductaflow behavior)')
     parser.add_argument('--no-execute', action='store_true',
                        help='Set up execution environment but do not run - for testing/debugging')
     args = parser.parse_args()
     
-    with open(args.config, 'r') as f:
-        config = json.load(f)
+    if args.config_stdin:
+        config = _loads_json(sys.stdin.buffer.read())
+        config_label, config_source = "stdin", None
+    elif args.config_env:
+        if args.config_env not in os.environ:
+            parser.error(f"environment variable {args.config_env} is not set")
+        config = _loads_json(os.environ[args.config_env])
+        config_label, config_source = f"${args.config_env}", None
+    else:
+        config = _load_json(args.config)
+        # Absolute so the file can still be copied after changing to --output-dir
+        config_label, config_source = args.config, os.path.abspath(args.config)
+    config_modified = False
     
     # Set up logging for CLI mode
     flow_name = Path(sys.argv[0]).stem if sys.argv else "flow"
     execution_log = Path(f"{flow_name}_execution_output.txt")
     logger = setup_execution_logging(execution_log, "ductaflow")
     
-    logger.info(f"📊 Loaded config from {args.config}")
+    logger.info(f"📊 Loaded config from {config_label}")
     
     # Simple project root injection for CLI mode
     if '_project_root' not in config:
-        config['_project_root'] = str(Path.cwd().resolve())
+        config['_project_root'] = _project_root_default()
+        config_modified = True
     logger.info(f"📁 Project context: {config['_project_root']}")
     
     # Handle --no-execute mode
     if args.no_execute:
         logger.info("🔍 --no-execute mode: Setting up environment without execution")
         config['_no_execute'] = True
+        config_modified = True
     
     # Change to output directory if specified (matches ductaflow execution_dir behavior)
     if args.output_dir:
@@ -579,17 +873,25 @@ def load_cli_config(default_config_path: str, description: str = 'Run ductaflow
         
         # Save config to output directory for reproducibility
         config_filename = f"{flow_name}_config.json"
-        with open(config_filename, 'w') as f:
-            json.dump(config, f, indent=2, default=str)
+        if config_modified or config_source is None:
+            _dump_json(config, config_filename)
+        elif not (os.path.exists(config_filename) and os.path.samefile(config_source, config_filename)):
+            # Unchanged config - copy the original bytes rather than re-serializing
+            shutil.copyfile(config_source, config_filename)
         logger.info(f"💾 Saved config to: {config_filename}")
     else:
         logger.info(f"🚀 Running as CLI script in: {os.getcwd()}")
     
     return config
 
+# Config keys that unpack_config converts to Path objects
+_PATH_KEYS = frozenset(['model_runs_dir', 'run_folder', 'output_dir', 'data_dir', 
+                        'input_dir', 'results_dir', '_project_root'])
+
 def unpack_config(config: Optional[Dict] = None, 
                  flow_name: Optional[str] = None,
-                 caller_locals: Optional[Dict] = None) -> Dict[str, Any]:
+                 caller_locals: Optional[Dict] = None,
+                 verbose: bool = False) -> Dict[str, Any]:
     """
     Standardized config unpacking for flows and builds.
     
@@ -598,10 +900,14 @@ def unpack_config(config: Optional[Dict] = None,
     - Converts common path strings to Path objects
     - Displays config summary
     
+    Only plain dicts are flattened (exact type check) - JSON and papermill
+    configs never contain dict subclasses, so these are not special-cased.
+    
     Args:
         config: Configuration dictionary
         flow_name: Name for display in config summary
         caller_locals: locals() dict from calling scope to update
+        verbose: Print every unpacked variable (also enabled by env DUCTAFLOW_VERBOSE=1)
         
     Returns:
         Dictionary of unpacked variables
@@ -623,44 +929,162 @@ def unpack_config(config: Optional[Dict] = None,
     
     unpacked_vars = {}
     
-    print("📋 Unpacking config variables:")
-    
     # Extract config variables
     for key, value in config.items():
-        if isinstance(value, dict):
-            # Add the dict itself
-            unpacked_vars[key] = value
-            print(f"📋 {key} = {{{len(value)} items}}")
-            
+        unpacked_vars[key] = value
+        if type(value) is dict:
             # Flatten nested dict keys
-            for sub_key, sub_value in value.items():
-                unpacked_vars[sub_key] = sub_value
-                print(f"📋   {sub_key} = {sub_value}")
-        else:
-            unpacked_vars[key] = value
-            print(f"📋 {key} = {value}")
+            unpacked_vars.update(value)
     
     # Convert common path variables to Path objects
-    path_keys = ['model_runs_dir', 'run_folder', 'output_dir', 'data_dir', 
-                 'input_dir', 'results_dir', '_project_root']
-    
-    for key in path_keys:
-        if key in unpacked_vars and unpacked_vars[key] is not None:
+    converted_keys = []
+    for key in unpacked_vars.keys() & _PATH_KEYS:
+        if unpacked_vars[key] is not None:
             unpacked_vars[key] = Path(unpacked_vars[key])
-            print(f"🗂️  Converted {key} to Path object")
-    
+            converted_keys.append(key)
     
     # Update caller's locals if provided
     if caller_locals is not None:
         caller_locals.update(unpacked_vars)
     
-    print(f"✅ Unpacked {len(unpacked_vars)} config variables")
+    # Build all output first and emit it in one write
+    lines = []
+    if verbose or os.environ.get('DUCTAFLOW_VERBOSE', '0') not in ('', '0'):
+        lines.append("📋 Unpacking config variables:")
+        for key, value in config.items():
+            if type(value) is dict:
+                lines.append(f"📋 {key} = {{{len(value)} items}}")
+                lines.extend(f"📋   {sub_key} = {sub_value}" for sub_key, sub_value in value.items())
+            else:
+                lines.append(f"📋 {key} = {value}")
+        lines.extend(f"🗂️  Converted {key} to Path object" for key in sorted(converted_keys))
+    
+    lines.append(f"✅ Unpacked {len(unpacked_vars)} config variables")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
     
     return unpacked_vars
 
 # %% [markdown]
 # ## Core Notebook Execution Function
 
+# %%
+def _stdout_is_interactive() -> bool:
+    """True if stdout is a terminal (stdout may be replaced by objects without isatty)."""
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+# %%
+def _notebook_cache_dir() -> Path:
+    """Directory holding cached .py -> .ipynb conversions (~/.cache/ductaflow by default)."""
+    cache_home = os.environ.get('XDG_CACHE_HOME')
+    return (Path(cache_home) if cache_home else Path.home() / '.cache') / 'ductaflow'
+
+def _compiled_notebook_path(source_notebook: Path, kernel_name: str) -> Path:
+    """
+    Convert a Jupytext .py notebook to .ipynb, reusing a cached conversion when possible.
+    
+    The cache key is a hash of the source bytes, kernel name and jupytext version,
+    so unchanged flows are only parsed by jupytext once across runs.
+    
+    Args:
+        source_notebook: Path to the .py notebook
+        kernel_name: Kernel to set in the notebook metadata if none is specified
+        
+    Returns:
+        Absolute path to the cached .ipynb file
+    """
+    import jupytext
+    
+    digest = hashlib.blake2b(source_notebook.read_bytes(), digest_size=16)
+    digest.update(f"\0{kernel_name}\0{getattr(jupytext, '__version__', '')}".encode())
+    cache_dir = _notebook_cache_dir()
+    cached_ipynb = cache_dir / f"{source_notebook.stem}-{digest.hexdigest()}.ipynb"
+    
+    if cached_ipynb.exists():
+        return cached_ipynb
+    
+    # Read the jupytext file
+    nb = jupytext.read(source_notebook)
+    
+    # Add kernel specification if missing
+    if 'kernelspec' not in nb.metadata:
+        nb.metadata['kernelspec'] = {
+            "display_name": "Python 3",
+            "language": "python",
+            "name": kernel_name
+        }
+    
+    # Write to a temporary name then rename, so concurrent runs never see a partial file
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    temp_ipynb = cached_ipynb.with_name(f"{cached_ipynb.name}.{os.getpid()}.tmp")
+    jupytext.write(nb, temp_ipynb, fmt='ipynb')
+    os.replace(temp_ipynb, cached_ipynb)
+    
+    return cached_ipynb
+
+@functools.lru_cache(maxsize=128)
+def _compiled_notebook_memo(source_path: str, mtime_ns: int, size: int, kernel_name: str) -> Path:
+    """_compiled_notebook_path memoized per source file version, so repeat runs of an unchanged flow skip re-reading and hashing it."""
+    return _compiled_notebook_path(Path(source_path), kernel_name)
+
+# %%
+@functools.lru_cache(maxsize=None)
+def _resolve_dir(path: str) -> str:
+    """Fully resolved form of an absolute directory path (symlink walk done once per path)."""
+    return str(Path(path).resolve())
+
+def _project_root_default() -> str:
+    """Resolved current working directory, used when no project root is given."""
+    # Keyed on os.getcwd() so the cache stays correct across os.chdir calls
+    return _resolve_dir(os.getcwd())
+
+def _resolve_source_notebook(notebook_file: Path,
+                             notebooks_dir: Optional[Union[str, Path]],
+                             kernel_name: str) -> Path:
+    """
+    Locate the notebook to execute, converting Jupytext .py files to (cached) .ipynb.
+    
+    Returns:
+        Absolute path papermill/nbclient should read (safe to use after os.chdir)
+        
+    Raises:
+        FileNotFoundError: If the notebook doesn't exist
+    """
+    if notebooks_dir:
+        source_notebook = Path(notebooks_dir) / notebook_file
+    else:
+        source_notebook = notebook_file
+    
+    # Stat-ing the source doubles as the existence check
+    try:
+        stat = os.stat(source_notebook)
+        if source_notebook.suffix == '.py':
+            compiled = _compiled_notebook_memo(os.path.abspath(source_notebook),
+                                               stat.st_mtime_ns, stat.st_size, kernel_name)
+            if not compiled.exists():
+                # Conversion cache was cleared while this process was running
+                compiled = _compiled_notebook_path(source_notebook, kernel_name)
+            return compiled
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Notebook file not found: {source_notebook}") from None
+    
+    if source_notebook.is_absolute():
+        return source_notebook
+    return Path(os.path.abspath(source_notebook))  # No symlink walk needed, unlike resolve()
+
+def _resolve_project_root(project_root: Optional[Union[str, Path]], config: Dict[str, Any]) -> str:
+    """Project root to inject as _project_root: explicit argument, then config, then current directory."""
+    if project_root:
+        return _resolve_dir(os.path.abspath(project_root))
+    elif '_project_root' not in config:
+        # Auto-detect project root - use current directory before any changes
+        return _project_root_default()
+    else:
+        return _resolve_dir(os.path.abspath(config['_project_root']))
+
 # %%
 def run_notebook(notebook_file: Union[str, Path], 
                 notebooks_dir: Optional[Union[str, Path]] = None,
@@ -668,10 +1092,11 @@ def run_notebook(notebook_file: Union[str, Path],
                 output_suffix: str = "_executed",
                 kernel_name: str = "python3",
                 timeout: Optional[int] = None,
-                export_html: bool = True,
+                export_html: Union[bool, str] = True,
                 execution_dir: Optional[Union[str, Path]] = None,
                 project_root: Optional[Union[str, Path]] = None,
-                no_execute: bool = False) -> Path:
+                no_execute: bool = False,
+                kernel_manager: Optional[Any] = None) -> Path:
     """
     Execute a Jupytext .py file as a notebook with configuration parameters
     
@@ -682,96 +1107,71 @@ def run_notebook(notebook_file: Union[str, Path],
         output_suffix: Suffix for output notebook filename
         kernel_name: Jupyter kernel to use for execution
         timeout: Execution timeout in seconds (None for unlimited)
-        export_html: Whether to also export an HTML version of the executed notebook
-        execution_dir: Directory where notebook should be executed (changes working directory)
+        export_html: Whether to also export an HTML version of the executed notebook.
+                     True exports before returning; "background" exports on a thread
+                     pool instead (see wait_for_html_exports)
+        execution_dir: Directory where notebook should be executed (the kernel's working
+                       directory). papermill switches the process working directory
+                       there for the duration of the run and restores it afterwards,
+                       so don't call run_notebook from several threads at once - use
+                       run_notebook_async / run_notebooks_parallel for that
         project_root: Path to project root (auto-injects _project_root, _flows_dir, _builds_dir into config)
         no_execute: If True, set up environment but don't execute notebook (for testing)
+        kernel_manager: Already-running jupyter_client KernelManager to execute in instead of
+                        starting a new kernel (see run_notebook_session)
     
     Returns:
-        Path to the executed notebook file
+        Absolute path to the executed notebook file
         
     Raises:
         FileNotFoundError: If notebook or config file not found
         PapermillExecutionError: If notebook execution fails
     """
-    if pm is None:
-        raise ImportError("papermill is required for notebook execution. Install with: pip install papermill")
+    pm = _require_papermill()
     
     # Setup paths
     notebook_file = Path(notebook_file)
-    
-    if notebooks_dir:
-        source_notebook = Path(notebooks_dir) / notebook_file
+    notebook_stem = notebook_file.stem
+    input_path = os.fspath(_resolve_source_notebook(notebook_file, notebooks_dir, kernel_name))
+    
+    # Everything the run writes uses absolute paths inside the execution directory.
+    # papermill's cwd= still chdirs this process for the run (restored afterwards);
+    # only run_notebook_async leaves the process working directory alone
+    if execution_dir:
+        run_dir = Path(os.path.abspath(execution_dir))
+        run_dir.mkdir(parents=True, exist_ok=True)
+        print(f"📁 Execution directory: {execution_dir}")
     else:
-        source_notebook = notebook_file
-    
-    if not source_notebook.exists():
-        raise FileNotFoundError(f"Notebook file not found: {source_notebook}")
+        run_dir = Path(os.getcwd())
     
     # Setup output path
     # Always just put the executed notebook in the run folder
-    output_notebook = Path(f"./{notebook_file.stem}{output_suffix}.ipynb")
-    
-    # Convert .py to .ipynb if needed
-    temp_ipynb = None
-    if source_notebook.suffix == '.py':
-        # Read the jupytext file
-        nb = jupytext.read(source_notebook)
-        
-        # Add kernel specification if missing
-        if 'kernelspec' not in nb.metadata:
-            nb.metadata['kernelspec'] = {
-                "display_name": "Python 3",
-                "language": "python",
-                "name": kernel_name
-            }
-        
-        # Write temporary .ipynb file - resolve to absolute path before directory change
-        temp_ipynb = source_notebook.with_suffix('.ipynb').resolve()
-        jupytext.write(nb, temp_ipynb)
-        source_notebook = temp_ipynb
+    output_notebook = run_dir / f"{notebook_stem}{output_suffix}.ipynb"
     
     try:       
-        # Determine project root BEFORE changing directories
-        if project_root:
-            project_root_path = str(Path(project_root).resolve())
-        elif '_project_root' not in config:
-            # Auto-detect project root - use current directory before any changes
-            project_root_path = str(Path.cwd().resolve())
-        else:
-            project_root_path = str(Path(config['_project_root']).resolve())
-        
-        # Handle execution directory change if specified
-        original_cwd = None
-        if execution_dir:
-            execution_dir = Path(execution_dir)
-            execution_dir.mkdir(parents=True, exist_ok=True)
-            original_cwd = os.getcwd()
-            os.chdir(execution_dir)
-            print(f"📁 Changed to execution directory: {execution_dir}")
+        project_root_path = _resolve_project_root(project_root, config)
         
         # Simple project root injection
-        enhanced_config = config.copy()
-        enhanced_config['_project_root'] = project_root_path
+        enhanced_config = {**config, '_project_root': project_root_path}
         
         # Save enhanced config to output directory for reproducibility
-        config_filename = f"{notebook_file.stem}_config.json"
-        with open(config_filename, 'w') as f:
-            json.dump(enhanced_config, f, indent=2, default=str)
+        config_filename = f"{notebook_stem}_config.json"
+        _dump_json(enhanced_config, run_dir / config_filename)
         print(f"💾 Saved config to: {config_filename}")
         print(f"📁 Project context: {enhanced_config.get('_project_root', 'current directory')}")
         
         # Check for no-execute mode
         if no_execute or config.get('_no_execute', False):
             print(f"🔍 No-execute mode: Environment set up for {notebook_file}")
-            print(f"📁 Working directory: {os.getcwd()}")
+            print(f"📁 Working directory: {run_dir}")
             print(f"📋 Config available: {config_filename}")
             print(f"🚀 To debug: Open {notebook_file} as notebook and run cells interactively")
             
             # Create a placeholder executed notebook for consistency
-            placeholder_notebook = Path(f"./{notebook_file.stem}{output_suffix}.ipynb")
+            placeholder_notebook = output_notebook
             if notebook_file.suffix == '.py':  # Check original file, not converted one
                 # Convert to notebook format for interactive use
+                import jupytext
                 nb = jupytext.read(notebook_file)  # Read original .py file
                 
                 # Inject config parameters into the notebook
@@ -796,30 +1196,41 @@ def run_notebook(notebook_file: Union[str, Path],
             return placeholder_notebook
         
         # Set up execution logging using our logging utility
-        execution_log = Path(f"{notebook_file.stem}_execution_output.txt")
-        logger = setup_execution_logging(execution_log, f"flow:{notebook_file.stem}")
+        execution_log = run_dir / f"{notebook_stem}_execution_output.txt"
+        logger = setup_execution_logging(execution_log, f"flow:{notebook_stem}")
         
         # Set up papermill execution parameters
         execute_params = {
-            "input_path": str(source_notebook),
-            "output_path": str(output_notebook),
+            "input_path": input_path,
+            "output_path": os.fspath(output_notebook),
             "parameters": {"config": enhanced_config},  # Use enhanced config with project context
             "kernel_name": kernel_name,
+            # The kernel is started in the execution directory, so flows still see
+            # os.getcwd() == execution_dir and relative paths resolve there
+            "cwd": os.fspath(run_dir),
             "request_save_on_cell_execute": True,
-            "progress_bar": True
+            # tqdm redraws only make sense on a terminal; in logs/notebooks they're just noise
+            "progress_bar": _stdout_is_interactive()
         }
         
         # Only add timeout if it's specified (not None)
         if timeout is not None:
             execute_params["execution_timeout"] = timeout
         
+        if kernel_manager is not None:
+            execute_params["km"] = kernel_manager
+        
         try:
             # Log execution start
             logger.info("🚀 Execution started")
-            logger.info(f"📁 Working directory: {os.getcwd()}")
+            logger.info(f"📁 Working directory: {run_dir}")
             logger.info(f"📋 Config: {config_filename}")
             logger.info("-" * 60)
             
+            if kernel_manager is not None:
+                # A reused kernel keeps the previous run's namespace and directory
+                _reset_session_kernel(kernel_manager, os.fspath(run_dir))
+            
             # Execute notebook
             pm.execute_notebook(
                 **execute_params,
@@ -834,27 +1245,15 @@ def run_notebook(notebook_file: Union[str, Path],
             raise
         
         finally:
-            # Close all file handlers to release file locks (important on Windows)
+            # Flush and close the log file to release file locks (important on Windows)
             # This prevents PermissionError when trying to delete execution directories
-            try:
-                for handler in logger.handlers[:]:
-                    if isinstance(handler, logging.FileHandler):
-                        handler.close()
-                        logger.removeHandler(handler)
-            except Exception:
-                # Ignore errors when closing handlers (e.g., if already closed)
-                pass
+            teardown_execution_logging(logger)
         
         print(f"✓ Successfully executed: {notebook_file}")
         
         # Export to HTML if requested
         if export_html:
-            try:
-                html_output = output_notebook.with_suffix('.html')
-                convert_notebook_to_html(output_notebook, html_output)
-                print(f"✓ HTML export created: {html_output}")
-            except Exception as e:
-                print(f"⚠️ HTML export failed: {e}")
+            _export_notebook_html(output_notebook, export_html)
         
         return output_notebook
         
@@ -864,18 +1263,230 @@ def run_notebook(notebook_file: Union[str, Path],
         # Papermill automatically saves the failed notebook with error state
         raise
     
+    return output_notebook
+
+# %%
+def _reset_session_kernel(kernel_manager: Any, cwd: str) -> None:
+    """Clear a reused kernel's user namespace and move it to cwd before the next notebook."""
+    kernel_client = kernel_manager.client()
+    kernel_client.start_channels()
+    try:
+        kernel_client.wait_for_ready(timeout=60)
+        reply = kernel_client.execute_interactive(
+            f"get_ipython().run_line_magic('reset', '-f')\n"
+            f"import os as _os; _os.chdir({cwd!r}); del _os",
+            silent=True, store_history=False
+        )
+        if reply['content']['status'] != 'ok':
+            raise RuntimeError(f"Failed to reset session kernel: {reply['content'].get('evalue', '')}")
     finally:
-        # Restore original working directory if changed
-        if original_cwd:
-            os.chdir(original_cwd)
-            print(f"📁 Restored working directory: {original_cwd}")
+        kernel_client.stop_channels()
+
+@contextlib.contextmanager
+def run_notebook_session(kernel_name: str = "python3"):
+    """
+    Run a series of notebooks in one reused Jupyter kernel.
+    
+    Kernel startup and heavy library imports are paid once per session instead
+    of once per notebook. Each run starts with a cleared namespace in its own
+    execution directory, but imported modules (and any module-level state in
+    them) persist between runs - edits to local modules won't be picked up
+    until the session ends.
+    
+    Args:
+        kernel_name: Jupyter kernel to start for the session
+        
+    Yields:
+        run_notebook with the session kernel bound (same arguments as run_notebook)
+        
+    Usage:
+        with run_notebook_session() as run:
+            for name, cfg in scenario_configs.items():
+                run("flows/my_flow.py", config=cfg, execution_dir=f"runs/sweep/{name}")
+    """
+    _require_papermill()
+    from jupyter_client import KernelManager
+    
+    kernel_manager = KernelManager(kernel_name=kernel_name)
+    kernel_manager.start_kernel()
+    print(f"🔌 Started session kernel: {kernel_name}")
+    try:
+        yield functools.partial(run_notebook, kernel_name=kernel_name, kernel_manager=kernel_manager)
+    finally:
+        kernel_manager.shutdown_kernel(now=True)
+        print(f"🔌 Shut down session kernel: {kernel_name}")
+
+# %%
+async def run_notebook_async(notebook_file: Union[str, Path],
+                             execution_dir: Union[str, Path],
+                             config: Optional[Dict[str, Any]] = None,
+                             notebooks_dir: Optional[Union[str, Path]] = None,
+                             output_suffix: str = "_executed",
+                             kernel_name: str = "python3",
+                             timeout: Optional[int] = None,
+                             export_html: Union[bool, str] = True,
+                             project_root: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Execute a Jupytext .py file as a notebook without blocking the event loop.
+    
+    Async counterpart of run_notebook built on nbclient, so several notebooks can
+    execute at once (see run_notebooks_parallel). The process working directory is
+    never changed: the kernel is started in execution_dir and the config, log and
+    executed notebook are written there using absolute paths.
+    
+    Args:
+        notebook_file: Path to the .py notebook file to execute
+        execution_dir: Directory where notebook should be executed
+        config: Dictionary of config vars (default: empty)
+        notebooks_dir: Directory containing notebook files (defaults to current working directory)
+        output_suffix: Suffix for output notebook filename
+        kernel_name: Jupyter kernel to use for execution
+        timeout: Per-cell execution timeout in seconds (None for unlimited)
+        export_html: Whether to also export an HTML version. True exports before
+                     returning (on a worker thread, so the event loop keeps running);
+                     "background" returns without waiting (see wait_for_html_exports)
+        project_root: Path to project root (injected into config as _project_root)
+    
+    Returns:
+        Absolute path to the executed notebook file
+        
+    Raises:
+        FileNotFoundError: If notebook not found
+        CellExecutionError: If notebook execution fails (executed notebook is still saved)
+    """
+    _require_papermill()
+    import nbformat
+    from nbclient import NotebookClient
+    from papermill.parameterize import parameterize_notebook
+    
+    if config is None:
+        config = {}
+    notebook_file = Path(notebook_file)
+    source_notebook = _resolve_source_notebook(notebook_file, notebooks_dir, kernel_name)
+    project_root_path = _resolve_project_root(project_root, config)
+    
+    execution_dir = Path(execution_dir).resolve()
+    execution_dir.mkdir(parents=True, exist_ok=True)
+    output_notebook = execution_dir / f"{notebook_file.stem}{output_suffix}.ipynb"
+    
+    # Simple project root injection
+    enhanced_config = {**config, '_project_root': project_root_path}
+    
+    # Save enhanced config to output directory for reproducibility
+    config_path = execution_dir / f"{notebook_file.stem}_config.json"
+    _dump_json(enhanced_config, config_path)
+    print(f"💾 Saved config to: {config_path}")
+    
+    # Logger name includes the directory so concurrent runs of one flow don't share handlers;
+    # unregistered, so a long sweep doesn't leave one logger per run in logging's registry
+    execution_log = execution_dir / f"{notebook_file.stem}_execution_output.txt"
+    logger = setup_execution_logging(execution_log, f"flow:{notebook_file.stem}:{execution_dir}",
+                                     registered=False)
+    
+    nb = nbformat.read(str(source_notebook), as_version=4)
+    nb = parameterize_notebook(nb, {"config": enhanced_config}, kernel_name=kernel_name, language='python')
+    client = NotebookClient(nb, kernel_name=kernel_name, timeout=timeout,
+                            resources={'metadata': {'path': str(execution_dir)}})
+    
+    try:
+        logger.info("🚀 Execution started")
+        logger.info(f"📁 Working directory: {execution_dir}")
+        logger.info(f"📋 Config: {config_path.name}")
+        logger.info("-" * 60)
+        
+        await client.async_execute()
+        
+        logger.info("-" * 60)
+        logger.info("✅ Execution completed")
         
-        # Clean up temporary files
-        if temp_ipynb and temp_ipynb.exists():
-            temp_ipynb.unlink()
+    except Exception as e:
+        logger.error(f"❌ Execution failed: {str(e)}")
+        raise
+    
+    finally:
+        # Save the notebook even on failure so the error state can be inspected
+        nbformat.write(nb, str(output_notebook))
+        teardown_execution_logging(logger)
+    
+    print(f"✓ Successfully executed: {notebook_file} in {execution_dir}")
+    
+    if export_html == "background":
+        _export_notebook_html(output_notebook, export_html)
+    elif export_html:
+        await asyncio.get_running_loop().run_in_executor(
+            _html_executor(), _export_notebook_html, output_notebook, True)
     
     return output_notebook
 
+def run_notebooks_parallel(specs: List[Dict[str, Any]], max_concurrency: Optional[int] = None) -> List[Path]:
+    """
+    Execute several notebooks concurrently with run_notebook_async.
+    
+    Nothing changes the process working directory, so independent flows overlap
+    kernel startup, execution and HTML export. Safe to call from a notebook
+    (where an event loop is already running) as well as from scripts.
+    
+    Args:
+        specs: One dict of run_notebook_async keyword arguments per execution
+               (each needs at least notebook_file and execution_dir)
+        max_concurrency: Maximum notebooks running at once (default: CPU count)
+        
+    Returns:
+        Executed notebook paths, in the same order as specs
+        
+    Usage:
+        run_notebooks_parallel([
+            {"notebook_file": "flows/my_flow.py", "execution_dir": f"runs/sweep/{name}", "config": cfg}
+            for name, cfg in scenario_configs.items()
+        ], max_concurrency=4)
+    """
+    async def _run_all():
+        semaphore = asyncio.Semaphore(max_concurrency or os.cpu_count() or 1)
+        
+        async def _run_one(spec):
+            async with semaphore:
+                return await run_notebook_async(**spec)
+        
+        return await asyncio.gather(*(_run_one(spec) for spec in specs))
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return list(asyncio.run(_run_all()))
+    
+    # Called from a running event loop (e.g. a conductor notebook's kernel), where
+    # asyncio.run refuses to start - drive the flows from a helper thread instead
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return list(executor.submit(asyncio.run, _run_all()).result())
+
+# %%
+def _fast_rmtree(path: Union[str, Path], max_workers: int = 8) -> None:
+    """
+    Delete a directory tree, removing its top-level subtrees in parallel.
+    
+    Run directories are often many small files spread over flow subfolders; deleting
+    those subfolders concurrently overlaps the unlink syscalls. Uses plain
+    shutil.rmtree on Windows.
+    """
+    if os.name == 'nt':
+        shutil.rmtree(path)
+        return
+    
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            else:
+                os.unlink(entry.path)
+    
+    if subdirs:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(subdirs))) as executor:
+            # list() re-raises the first failure
+            list(executor.map(shutil.rmtree, subdirs))
+    
+    os.rmdir(path)
+
 # %%
 def debug_flow(flow_path: str, execution_dir: Union[str, Path], config: Dict[str, Any] = None, force: bool = False) -> Path:
     """
@@ -908,10 +1519,6 @@ def debug_flow(flow_path: str, execution_dir: Union[str, Path], config: Dict[str
         # Debug a flow within a build's nested structure
         debug_flow("flows/flow_shell1.py", "runs/build_instance/execution/setup/flow_shell1", config)
     """
-    from pathlib import Path
-    import json
-    import shutil
-    
     execution_dir = Path(execution_dir)
     flow_name = Path(flow_path).stem
     
@@ -919,24 +1526,25 @@ def debug_flow(flow_path: str, execution_dir: Union[str, Path], config: Dict[str
     if execution_dir.exists():
         if force:
             print(f"🗑️ Removing existing directory: {execution_dir}")
-            shutil.rmtree(execution_dir)
+            _fast_rmtree(execution_dir)
         elif config is None:
             # Try to load existing config - check multiple possible config file names
-            possible_configs = [
-                execution_dir / f"{flow_name}_config.json",
-                execution_dir / "config.json",
-                execution_dir / f"{execution_dir.name}_config.json"  # For build instances
-            ]
+            # against a single directory listing rather than stat-ing each candidate
+            with os.scandir(execution_dir) as entries:
+                existing_files = {entry.name for entry in entries}
             
-            existing_config = None
-            for config_path in possible_configs:
-                if config_path.exists():
-                    existing_config = config_path
-                    break
+            possible_configs = (
+                f"{flow_name}_config.json",
+                "config.json",
+                f"{execution_dir.name}_config.json"  # For build instances
+            )
+            
+            # Only the first match becomes a Path
+            config_name = next((name for name in possible_configs if name in existing_files), None)
             
-            if existing_config:
-                with open(existing_config, 'r') as f:
-                    config = json.load(f)
+            if config_name:
+                existing_config = execution_dir / config_name
+                config = _load_json(existing_config)
                 print(f"📋 Using existing config from: {existing_config}")
             else:
                 raise ValueError(f"Directory {execution_dir} exists but no config provided and no existing config found. Use force=True to recreate.")
@@ -962,10 +1570,11 @@ def debug_flow(flow_path: str, execution_dir: Union[str, Path], config: Dict[str
     config_filename = f"{flow_name}_config.json"
     
     # Create a clean debug name from the execution path
+    exec_str = str(execution_dir)
     debug_name_parts = []
-    if "conductor_runs" in str(execution_dir):
+    if "conductor_runs" in exec_str:
         debug_name_parts.append("Conductor")
-    if "build" in str(execution_dir).lower():
+    if "build" in exec_str.lower():
         debug_name_parts.append("Build")
     debug_name_parts.extend([flow_name, execution_dir.name])
     debug_name = " - ".join(debug_name_parts)
@@ -979,7 +1588,7 @@ def debug_flow(flow_path: str, execution_dir: Union[str, Path], config: Dict[str
                 "request": "launch",
                 "program": "${workspaceFolder}/" + flow_path,
                 "args": ["--config", config_filename],
-                "cwd": "${workspaceFolder}/" + str(execution_dir),
+                "cwd": "${workspaceFolder}/" + exec_str,
                 "console": "integratedTerminal",
                 "justMyCode": False,
                 "stopOnEntry": False
@@ -996,7 +1605,7 @@ def debug_flow(flow_path: str, execution_dir: Union[str, Path], config: Dict[str
 
             🚀 Add this to .vscode/launch.json:
             """)
-    print(json.dumps(launch_config, indent=2))
+    print(_format_json(launch_config))
     
     print(f"""
             💡 Next steps:
@@ -1031,8 +1640,6 @@ def run_step_flow(notebook_path: str, step_name: str, instance_name: str, config
     Returns:
         Path to executed notebook
     """
-    import time
-    
     # Build full instance name with suffix if provided
     full_instance_name = f"{instance_name}{suffix}" if suffix else instance_name
     
@@ -1045,7 +1652,7 @@ def run_step_flow(notebook_path: str, step_name: str, instance_name: str, config
     print(f"🚀 Starting {flow_name} | Instance: {full_instance_name}")
     
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         result = run_notebook(
             notebook_file=notebook_path,
@@ -1055,7 +1662,7 @@ def run_step_flow(notebook_path: str, step_name: str, instance_name: str, config
         )
         
         # Simple completion logging
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         print(f"✅ Completed {flow_name} | Instance: {full_instance_name} | Time: {execution_time:.1f}s")
         
         return result
@@ -1065,11 +1672,229 @@ def run_step_flow(notebook_path: str, step_name: str, instance_name: str, config
         print(f"❌ Failed {flow_name} | Instance: {full_instance_name} | Error: {str(e)}")
         raise
 
+def _run_step_flow_worker(flow_call: Dict[str, Any]) -> Path:
+    """Process-pool entry point: run one step flow and finish its HTML export before the worker moves on."""
+    result = run_step_flow(**flow_call)
+    wait_for_html_exports()
+    return result
+
+def run_step_flows(flow_calls: List[Dict[str, Any]], max_workers: Optional[int] = None) -> List[Path]:
+    """
+    Execute independent step flows in parallel, one process per flow.
+    
+    Each call runs in its own worker process, so papermill's per-execution switch
+    into the execution directory doesn't interfere between flows. Only use this for flows with no dependencies
+    on each other's outputs.
+    
+    Args:
+        flow_calls: One dict of run_step_flow keyword arguments per execution
+                    (notebook_path, step_name, instance_name, config, optional suffix)
+        max_workers: Maximum flows running at once (default: CPU count)
+        
+    Returns:
+        run_step_flow results, in the same order as flow_calls
+        
+    Usage:
+        # Call from under `if __name__ == "__main__":` in scripts (needed on Windows)
+        results = run_step_flows([
+            {"notebook_path": "flows/my_flow.py", "step_name": "sweep",
+             "instance_name": name, "config": cfg}
+            for name, cfg in scenario_configs.items()
+        ])
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_run_step_flow_worker, flow_calls))
+
 # %% [markdown]
 # ## Status Analysis Functions
 
 # %%
-def analyze_execution_logs(output_dir: Union[str, Path]) -> str:
+# Status indicators to look for in first 15 characters of log lines
+_WARNING_INDICATORS = ('⚠️', 'warning:', 'Warning:', 'WARNING:')
+_ERROR_INDICATORS = ('❌', 'error:', 'Error:', 'ERROR:', 'Exception:', 'Failed:', 'failed:')
+
+# Matching is case-insensitive, so only the distinct lowercased forms are needed
+_WARNING_LOWER = tuple(dict.fromkeys(indicator.lower() for indicator in _WARNING_INDICATORS))
+_ERROR_LOWER = tuple(dict.fromkeys(indicator.lower() for indicator in _ERROR_INDICATORS))
+# Indicators only count within a line's first 15 characters. The file is searched as raw
+# UTF-8 bytes, so "up to N characters" is spelled as up to N lead bytes each followed by
+# their continuation bytes. Lone carriage returns end a line too, as with text-mode reads.
+_LOG_LINE_START = rb'(?:\A|(?<=[\r\n]))'
+_LOG_LINE_CHAR = rb'(?:[^\r\n\x80-\xbf][\x80-\xbf]*|[\x80-\xbf])'
+
+def _line_prefix_regex(indicators: Tuple[str, ...], window: int = 15) -> "re.Pattern":
+    """Bytes regex matching any indicator that fits entirely within the first `window` characters of a line."""
+    alternatives = [
+        _LOG_LINE_CHAR + b'{0,%d}' % (window - len(indicator)) + re.escape(indicator.encode('utf-8'))
+        for indicator in indicators
+    ]
+    return re.compile(_LOG_LINE_START + b'(?:' + b'|'.join(alternatives) + b')', re.IGNORECASE)
+
+_WARNING_PREFIX_RE = _line_prefix_regex(_WARNING_LOWER)
+_ERROR_PREFIX_RE = _line_prefix_regex(_ERROR_LOWER)
+_LINE_BREAK_RE = re.compile(rb'[\r\n]')
+
+# Failing runs end in a traceback - look for errors here before searching the whole log
+_ERROR_TAIL_BYTES = 64 * 1024
+
+def _scan_log_file(log_file: Union[str, Path], scan_window: Optional[int] = None) -> Tuple[bool, bool]:
+    """
+    Scan one execution log for status indicators.
+    
+    The file is memory-mapped and each indicator class is found with a single
+    regex search over the raw bytes - no decoding or per-line Python loop, and
+    each search stops at its first hit. Errors are looked for in the last 64KB
+    first; warnings are only searched for once the log is known to be error-free
+    (an error decides the status on its own).
+    
+    Args:
+        log_file: Log file to scan
+        scan_window: If set, only search the first and last scan_window bytes of
+                     larger files (startup failures and the final traceback)
+    
+    Returns:
+        (has_warnings, has_errors) - has_warnings is False whenever has_errors is True
+    """
+    with open(log_file, 'rb') as f:
+        try:
+            content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and filesystems without mmap support: search a plain bytes read
+            content = f.read()
+        
+        try:
+            searched = content
+            if scan_window and len(content) > 2 * scan_window:
+                tail = content[-scan_window:]
+                # Start the tail at a real line start so a cut line isn't read as one
+                line_break = _LINE_BREAK_RE.search(tail)
+                tail = tail[line_break.end():] if line_break else b''
+                searched = content[:scan_window] + b'\n' + tail
+            
+            # Searching from an offset is exact: the line-start lookbehind still
+            # sees the byte before it, and \A only matches at the real start
+            tail_start = len(searched) - _ERROR_TAIL_BYTES
+            if tail_start > 0 and _ERROR_PREFIX_RE.search(searched, tail_start) is not None:
+                return False, True
+            if _ERROR_PREFIX_RE.search(searched) is not None:
+                return False, True
+            has_warnings = _WARNING_PREFIX_RE.search(searched) is not None
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
+    
+    return has_warnings, False
+
+def _iter_execution_logs(root: Union[str, Path]) -> Iterator[str]:
+    """
+    Yield the absolute path of every *_execution_output.txt under root.
+    
+    Iterative os.scandir walk - directory type comes from the listing itself, so
+    (unlike Path.rglob) no extra stat or Path object is needed per entry.
+    Symlinked directories are not followed.
+    """
+    stack = [os.path.abspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith("_execution_output.txt"):
+                        yield entry.path
+        except OSError:
+            # Missing or unreadable directory - nothing to scan (as with rglob)
+            continue
+
+def _walk_run_tree(root: Union[str, Path]) -> Tuple[List[str], List[str]]:
+    """
+    Single scandir walk of a run tree, collecting both execution logs and flow directories.
+    
+    Flow directories are those directly inside a runs/ folder (what rglob("runs/*")
+    matches). Symlinked directories are only entered when they are flow directories.
+    
+    Returns:
+        (log_paths, flow_dirs) as absolute paths
+    """
+    log_paths = []
+    flow_dirs = []
+    stack = [(os.path.abspath(root), False)]
+    while stack:
+        current, in_runs = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False) or (in_runs and entry.is_dir()):
+                        if in_runs:
+                            flow_dirs.append(entry.path)
+                        stack.append((entry.path, entry.name == "runs"))
+                    elif entry.name.endswith("_execution_output.txt"):
+                        log_paths.append(entry.path)
+        except OSError:
+            continue
+    
+    return log_paths, flow_dirs
+
+@functools.lru_cache(maxsize=4096)
+def _scan_log_file_cached(log_path: str, mtime_ns: int, size: int,
+                          scan_window: Optional[int] = None) -> Tuple[bool, bool]:
+    """_scan_log_file memoized per file version, so overlapping directory scans read each log once."""
+    return _scan_log_file(log_path, scan_window)
+
+def _scan_log_status(log_path: str, scan_window: Optional[int] = None) -> Tuple[bool, bool]:
+    """(has_warnings, has_errors) for one log file (absolute path); unreadable logs count as errors."""
+    try:
+        stat = os.stat(log_path)
+        return _scan_log_file_cached(log_path, stat.st_mtime_ns, stat.st_size, scan_window)
+    except Exception:
+        # If we can't read a log file, treat as error
+        return False, True
+
+def _scan_logs(log_paths: List[str], scan_window: Optional[int] = None) -> List[Tuple[bool, bool]]:
+    """_scan_log_status for every path (concurrently when there are several), in input order."""
+    if len(log_paths) <= 1:
+        return [_scan_log_status(log_path, scan_window) for log_path in log_paths]
+    with ThreadPoolExecutor(max_workers=min(16, len(log_paths))) as executor:
+        return list(executor.map(functools.partial(_scan_log_status, scan_window=scan_window), log_paths))
+
+def _status_from_scans(scans: List[Tuple[bool, bool]]) -> str:
+    """Combine per-file (has_warnings, has_errors) scans into 'success', 'warning' or 'error'."""
+    if any(has_errors for _, has_errors in scans):
+        return 'error'
+    elif any(has_warnings for has_warnings, _ in scans):
+        return 'warning'
+    else:
+        return 'success'
+
+def _summarize_scenario(output_dir: Union[str, Path],
+                        scan_window: Optional[int] = None) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Overall and per-flow status of one scenario from a single walk and one scan per log.
+    
+    Equivalent to analyze_execution_logs on the scenario and on each of its flow
+    directories, without re-walking or re-reading shared logs.
+    
+    Returns:
+        (overall_status, [(flow_name, flow_status), ...])
+    """
+    output_dir = os.path.abspath(output_dir)
+    log_paths, flow_dirs = _walk_run_tree(output_dir)
+    log_scans = _scan_logs(log_paths, scan_window)
+    
+    # Each log counts toward every flow directory above it
+    flow_scans = {flow_dir: [] for flow_dir in flow_dirs}
+    for log_path, scan in zip(log_paths, log_scans):
+        parent = os.path.dirname(log_path)
+        while len(parent) > len(output_dir):
+            if parent in flow_scans:
+                flow_scans[parent].append(scan)
+            parent = os.path.dirname(parent)
+    
+    flow_statuses = [(os.path.basename(flow_dir), _status_from_scans(flow_scans[flow_dir]))
+                     for flow_dir in flow_dirs]
+    return _status_from_scans(log_scans), flow_statuses
+
+def analyze_execution_logs(output_dir: Union[str, Path], scan_window: Optional[int] = None) -> str:
     """
     Analyze execution logs to determine build and flow status.
     
@@ -1078,6 +1903,8 @@ def analyze_execution_logs(output_dir: Union[str, Path]) -> str:
     
     Args:
         output_dir: Directory containing execution logs
+        scan_window: Only scan the first and last scan_window bytes of each log
+                     (faster on multi-MB logs; default None scans everything)
         
     Returns:
         - 'success': No warnings or errors
@@ -1088,35 +1915,33 @@ def analyze_execution_logs(output_dir: Union[str, Path]) -> str:
         status = analyze_execution_logs("runs/my_build/scenario_1")
         print(f"Build status: {status}")  # 'success', 'warning', or 'error'
     """
-    output_dir = Path(output_dir)
-    log_files = list(output_dir.rglob("*_execution_output.txt"))
+    log_files = list(_iter_execution_logs(output_dir))
     
     has_warnings = False
     has_errors = False
     
-    # Status indicators to look for in first 15 characters of lines
-    warning_indicators = ['⚠️', 'warning:', 'Warning:', 'WARNING:']
-    error_indicators = ['❌', 'error:', 'Error:', 'ERROR:', 'Exception:', 'Failed:', 'failed:']
+    if len(log_files) <= 1:
+        scans = (_scan_log_status(log_file, scan_window) for log_file in log_files)
+        executor = None
+    else:
+        # Logs are independent and scanning is mostly I/O, so read them concurrently
+        executor = ThreadPoolExecutor(max_workers=min(16, len(log_files)))
+        futures = [executor.submit(_scan_log_status, log_file, scan_window) for log_file in log_files]
+        scans = (future.result() for future in as_completed(futures))
     
-    for log_file in log_files:
-        try:
-            content = log_file.read_text(encoding='utf-8')
-            for line in content.split('\n'):
-                # Only check first 15 characters to avoid false positives in data
-                line_start = line[:15].lower()
-                
-                # Check for warnings
-                if any(indicator.lower() in line_start for indicator in warning_indicators):
-                    has_warnings = True
-                
-                # Check for errors
-                if any(indicator.lower() in line_start for indicator in error_indicators):
-                    has_errors = True
-                    
-        except Exception:
-            # If we can't read a log file, treat as error
-            has_errors = True
-            continue
+    try:
+        for file_warnings, file_errors in scans:
+            has_warnings = has_warnings or file_warnings
+            has_errors = has_errors or file_errors
+            
+            # Status is 'error' whatever the remaining files contain
+            if has_errors:
+                break
+    finally:
+        if executor is not None:
+            for future in futures:
+                future.cancel()
+            executor.shutdown()
     
     if has_errors:
         return 'error'
@@ -1125,74 +1950,96 @@ def analyze_execution_logs(output_dir: Union[str, Path]) -> str:
     else:
         return 'success'
 
-def generate_status_report(results: list, model_root: Union[str, Path]) -> str:
-    """
-    Generate nested HTML status report showing build and flow-level status.
-    
-    Creates an expandable HTML report with:
-    - Build-level status (red/orange/green)
-    - Expandable sections showing individual flow status
-    - Summary statistics
-    
-    Args:
-        results: List of result dictionaries from conductor execution
-        model_root: Root directory containing execution outputs
-        
-    Returns:
-        HTML string for the status report
-        
-    Usage:
-        # After conductor execution
-        report_html = generate_status_report(results, model_root)
-        with open("status_report.html", 'w') as f:
-            f.write(report_html)
-    """
-    model_root = Path(model_root)
-    
-    html = f"""
+# Static head of the status report - only the timestamp and summary counts vary
+_REPORT_HEAD_TEMPLATE = string.Template("""
     <!DOCTYPE html>
     <html>
     <head>
         <title>Conductor Execution Report</title>
         <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; }}
-            .scenario {{ margin: 10px 0; border: 1px solid #ddd; border-radius: 5px; }}
-            .scenario-header {{ padding: 10px; cursor: pointer; font-weight: bold; }}
-            .scenario-content {{ padding: 10px; display: none; background: #f9f9f9; }}
-            .success {{ background-color: #d4edda; color: #155724; }}
-            .warning {{ background-color: #fff3cd; color: #856404; }}
-            .error {{ background-color: #f8d7da; color: #721c24; }}
-            .flow {{ margin: 5px 0; padding: 5px; border-radius: 3px; }}
-            .expand-btn {{ float: right; }}
-            .summary {{ background: #e9ecef; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
+            body { font-family: Arial, sans-serif; margin: 20px; }
+            .scenario { margin: 10px 0; border: 1px solid #ddd; border-radius: 5px; }
+            .scenario-header { padding: 10px; cursor: pointer; font-weight: bold; }
+            .scenario-content { padding: 10px; display: none; background: #f9f9f9; }
+            .success { background-color: #d4edda; color: #155724; }
+            .warning { background-color: #fff3cd; color: #856404; }
+            .error { background-color: #f8d7da; color: #721c24; }
+            .flow { margin: 5px 0; padding: 5px; border-radius: 3px; }
+            .expand-btn { float: right; }
+            .summary { background: #e9ecef; padding: 15px; border-radius: 5px; margin-bottom: 20px; }
         </style>
         <script>
-            function toggleScenario(id) {{
+            function toggleScenario(id) {
                 var content = document.getElementById(id);
                 var btn = document.getElementById(id + '_btn');
-                if (content.style.display === 'none') {{
+                if (content.style.display === 'none') {
                     content.style.display = 'block';
                     btn.innerHTML = '▼';
-                }} else {{
+                } else {
                     content.style.display = 'none';
                     btn.innerHTML = '▶';
-                }}
-            }}
+                }
+            }
         </script>
     </head>
     <body>
         <h1>🎯 Conductor Execution Report</h1>
-        <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+        <p><strong>Generated:</strong> $generated</p>
         
         <div class="summary">
             <h2>📊 Summary</h2>
-            <p><strong>Total Scenarios:</strong> {len(results)}</p>
-            <p><strong>Successful:</strong> {len([r for r in results if r['status'] == 'success'])}</p>
-            <p><strong>Failed:</strong> {len([r for r in results if r['status'] == 'failed'])}</p>
+            <p><strong>Total Scenarios:</strong> $total_scenarios</p>
+            <p><strong>Successful:</strong> $successful</p>
+            <p><strong>Failed:</strong> $failed</p>
         </div>
         
         <h2>📋 Scenario Details</h2>
+    """)
+
+_STATUS_ICONS = {'success': '✅', 'warning': '⚠️', 'error': '❌'}
+
+# Per-scenario block opening; the status class doubles as the CSS class
+_SCENARIO_HEADER_TEMPLATE = """
+        <div class="scenario">
+            <div class="scenario-header {status_class}" onclick="toggleScenario('scenario_{index}')">
+                {status_icon} {scenario_name}
+                <span class="expand-btn" id="scenario_{index}_btn">▶</span>
+            </div>
+            <div class="scenario-content" id="scenario_{index}">
+        """
+
+def generate_status_report(results: list, model_root: Union[str, Path],
+                           scan_window: Optional[int] = None) -> str:
     """
+    Generate nested HTML status report showing build and flow-level status.
+    
+    Creates an expandable HTML report with:
+    - Build-level status (red/orange/green)
+    - Expandable sections showing individual flow status
+    - Summary statistics
+    
+    Args:
+        results: List of result dictionaries from conductor execution
+        model_root: Root directory containing execution outputs
+        scan_window: Passed to analyze_execution_logs - limit log scans to head/tail bytes
+        
+    Returns:
+        HTML string for the status report
+        
+    Usage:
+        # After conductor execution
+        report_html = generate_status_report(results, model_root)
+        with open("status_report.html", 'w') as f:
+            f.write(report_html)
+    """
+    model_root = Path(model_root)
+    
+    parts = [_REPORT_HEAD_TEMPLATE.substitute(
+        generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        total_scenarios=len(results),
+        successful=sum(1 for r in results if r['status'] == 'success'),
+        failed=sum(1 for r in results if r['status'] == 'failed'),
+    )]
     
     for i, result in enumerate(results):
         scenario_name = result['scenario']
@@ -1200,48 +2047,37 @@ def generate_status_report(results: list, model_root: Union[str, Path]) -> str:
         
         # Analyze logs for detailed status if successful
         if status == 'success':
-            output_dir = model_root / "Model_Runs" / scenario_name
-            detailed_status = analyze_execution_logs(output_dir)
+            detailed_status, flow_statuses = _summarize_scenario(
+                model_root / "Model_Runs" / scenario_name, scan_window
+            )
         else:
             detailed_status = 'error'
         
-        status_class = detailed_status
-        status_icon = {'success': '✅', 'warning': '⚠️', 'error': '❌'}[detailed_status]
-        
-        html += f"""
-        <div class="scenario">
-            <div class="scenario-header {status_class}" onclick="toggleScenario('scenario_{i}')">
-                {status_icon} {scenario_name}
-                <span class="expand-btn" id="scenario_{i}_btn">▶</span>
-            </div>
-            <div class="scenario-content" id="scenario_{i}">
-        """
+        parts.append(_SCENARIO_HEADER_TEMPLATE.format_map({
+            'index': i,
+            'status_class': detailed_status,
+            'status_icon': _STATUS_ICONS[detailed_status],
+            'scenario_name': scenario_name,
+        }))
         
         if status == 'success':
             # Show flow-level details
-            output_dir = model_root / "Model_Runs" / scenario_name
-            flow_dirs = [d for d in output_dir.rglob("runs/*") if d.is_dir()]
-            
-            html += "<h4>Flow Status:</h4>"
-            for flow_dir in flow_dirs:
-                flow_name = flow_dir.name
-                flow_status = analyze_execution_logs(flow_dir)
-                flow_icon = {'success': '✅', 'warning': '⚠️', 'error': '❌'}[flow_status]
-                
-                html += f'<div class="flow {flow_status}">{flow_icon} {flow_name}</div>'
+            parts.append("<h4>Flow Status:</h4>")
+            for flow_name, flow_status in flow_statuses:
+                parts.append(f'<div class="flow {flow_status}">{_STATUS_ICONS[flow_status]} {flow_name}</div>')
             
             if 'duration_minutes' in result:
-                html += f"<p><strong>Duration:</strong> {result['duration_minutes']:.1f} minutes</p>"
+                parts.append(f"<p><strong>Duration:</strong> {result['duration_minutes']:.1f} minutes</p>")
         else:
-            html += f"<p><strong>Error:</strong> {result.get('error', 'Unknown error')}</p>"
+            parts.append(f"<p><strong>Error:</strong> {result.get('error', 'Unknown error')}</p>")
         
-        html += "</div></div>"
+        parts.append("</div></div>")
     
-    html += """
+    parts.append("""
         </body>
     </html>
-    """
+    """)
     
-    return html
+    return "".join(parts)
 
 
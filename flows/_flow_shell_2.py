@@ -47,9 +47,14 @@ if flow_shell_1_path.exists():
     available_files = list(flow_shell_1_path.glob("*"))
     print(f"📋 Available files: {[f.name for f in available_files]}")
     
-    # Access CSV results from Flow Shell 1
+    # Access results from Flow Shell 1 - Parquet if it wrote one, else CSV
+    parquet_file = flow_shell_1_path / "_flow_shell_1_results.parquet"
     csv_file = flow_shell_1_path / "_flow_shell_1_results.csv"
-    if csv_file.exists():
+    if parquet_file.exists():
+        print(f"📊 Loading results from Flow Shell 1: {parquet_file.name}")
+        df_upstream = pd.read_parquet(parquet_file)
+        print(f"📈 Loaded {len(df_upstream)} rows from upstream flow")
+    elif csv_file.exists():
         print(f"📊 Loading results from Flow Shell 1: {csv_file.name}")
         df_upstream = pd.read_csv(csv_file)
         print(f"📈 Loaded {len(df_upstream)} rows from upstream flow")
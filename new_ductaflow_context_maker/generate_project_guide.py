@@ -6,22 +6,29 @@ This script reads a project configuration and generates a comprehensive README
 that explains ductaflow philosophy, patterns, and implementation details.
 """
 
+import argparse
 import json
 import sys
-import io
 from pathlib import Path
 from datetime import datetime
 
-# Fix Windows console encoding for emojis
+try:
+    import orjson  # Optional: faster parsing for large scenario configs
+except ImportError:
+    orjson = None
+
+# Fix Windows console encoding for emojis - reconfigured in place, so importing
+# this module again (or after another module did the same) is a no-op
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    for _stream in (sys.stdout, sys.stderr):
+        if (getattr(_stream, 'encoding', None) or '').lower() != 'utf-8' and hasattr(_stream, 'reconfigure'):
+            _stream.reconfigure(encoding='utf-8', errors='replace')
 
 def load_project_config(config_path: str = "project_config.json") -> dict:
     """Load project configuration from JSON file."""
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        with open(config_path, 'rb') as f:
+            raw = f.read()
     except FileNotFoundError:
         print(f"❌ Config file {config_path} not found!")
         print("Creating example config file...")
@@ -39,12 +46,55 @@ def load_project_config(config_path: str = "project_config.json") -> dict:
             "description": "A transportation model that processes network data and generates travel forecasts"
         }
         
-        with open(config_path, 'w') as f:
-            json.dump(example_config, f, indent=2)
+        if orjson is not None:
+            Path(config_path).write_bytes(orjson.dumps(example_config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(config_path, 'w') as f:
+                json.dump(example_config, f, indent=2)
         
         print(f"✅ Created example {config_path}")
         print("Edit this file with your project details and run again.")
         sys.exit(1)
+    
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def validate_project_config(config: dict) -> None:
+    """Check the keys the guide needs up front, so a bad config fails before any rendering."""
+    problems = []
+    for key in ("project_name", "domain", "ductaflow_location"):
+        if not isinstance(config.get(key), str):
+            problems.append(f"'{key}' must be a string")
+    first_build_name = config.get("first_build_name", "")
+    if not isinstance(first_build_name, str):
+        problems.append("'first_build_name' must be a string (or left out)")
+    elif config.get("explain_build_level", True) and not first_build_name:
+        problems.append("'first_build_name' must be a non-empty string when 'explain_build_level' is true")
+    first_flow_names = config.get("first_flow_names")
+    if not isinstance(first_flow_names, list) or not first_flow_names:
+        problems.append("'first_flow_names' must be a non-empty list")
+    elif not all(isinstance(name, str) and name for name in first_flow_names):
+        problems.append("every entry in 'first_flow_names' must be a non-empty string")
+    scenario_dimensions = config.get("scenario_dimensions")
+    if not isinstance(scenario_dimensions, dict) or not scenario_dimensions:
+        problems.append("'scenario_dimensions' must be a non-empty object")
+    else:
+        first_values = next(iter(scenario_dimensions.values()))
+        if not isinstance(first_values, list) or not first_values:
+            problems.append("the first scenario dimension must be a non-empty list of values")
+        elif not all(isinstance(value, str) for value in first_values):
+            problems.append("every value of the first scenario dimension must be a string")
+    if problems:
+        raise ValueError("Invalid project config: " + "; ".join(problems))
+
+# Header every generated flow/build starts with
+MANDATORY_HEADER_TEMPLATE = """# Ductaflow mandatory header
+{import_statement}
+if not is_notebook_execution(): # CLI mode only
+    config = load_cli_config('{config_path}', '{cli_name}')
+# Standardized config unpacking - ductaflow fundamental
+vars().update(unpack_config(config, "{display_name}", locals()))
+# Display config summary for notebook instances
+display_config_summary(config, "{display_name}")"""
 
 def generate_import_statement(ductaflow_location: str) -> str:
     """Generate the appropriate import statement based on ductaflow location."""
@@ -68,29 +118,103 @@ def generate_project_guide(config: dict) -> str:
     
     import_statement = generate_import_statement(ductaflow_location)
     
+    # Short sections that differ between the build/flow and single-level guides
+    if explain_build_level:
+        builds_bullet = "- **Builds** orchestrate multiple flows in sequence"
+        via_builds = " (via builds)"
+        level_note = ("**Note**: This guide explains the full build/flow hierarchy. If you prefer a simpler "
+                      "single-level approach, you can skip builds and call flows directly from the conductor. "
+                      "See the CLI usage section below.")
+        builds_dir_tree = ("├── builds/                         # Orchestration of flows\n"
+                           f"│   └── {first_build_name}.py")
+        builds_config_tree = f"│   └── builds/\n│       └── {first_build_name}.json"
+        runs_root_name = first_build_name or "scenario_name"
+        step_4_heading = "### 4. Build the Complete Build"
+    else:
+        builds_bullet = ""
+        via_builds = ""
+        level_note = ("**Note**: This guide uses a single-level flow approach. Flows are called directly "
+                      "without an intermediate build layer. You can also call flows individually via CLI "
+                      "using their default config files.")
+        builds_dir_tree = "\n"
+        builds_config_tree = "│\n"
+        runs_root_name = "scenario_name"
+        step_4_heading = "### 4. Create the Conductor (Single-Level Flow Approach)"
+    
+    # One timestamp for header and footer
+    generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    # Display names used throughout the guide, computed once
+    flow_titles = [name.replace('_', ' ').title() for name in first_flow_names]
+    domain_lower = domain.lower()
+    
+    # Mandatory header blocks shown in the guide
+    flow_header = MANDATORY_HEADER_TEMPLATE.format(
+        import_statement=import_statement, config_path=f"config/flows/{first_flow_names[0]}.json",
+        cli_name=flow_titles[0], display_name=flow_titles[0])
+    # Build snippets only appear in the build-level guide (first_build_name may be unset otherwise)
+    if explain_build_level:
+        build_title = first_build_name.replace('_', ' ').title()
+        build_header = MANDATORY_HEADER_TEMPLATE.format(
+            import_statement=import_statement, config_path=f"config/builds/{first_build_name}.json",
+            cli_name=build_title, display_name=build_title)
+    else:
+        build_title = build_header = ""
+    example_header = MANDATORY_HEADER_TEMPLATE.format(
+        import_statement=import_statement, config_path="config/flows/my_flow.json",
+        cli_name="My Flow", display_name="My Flow Name")
+    
+    # Per-flow parts of the guide - one entry per configured flow, however many there are
+    last_flow = len(first_flow_names) - 1
+    flow_branches = ['└──' if i == last_flow else '├──' for i in range(len(first_flow_names))]
+    flow_file_tree = "\n".join(f"│   {branch} {name}.py" for branch, name in zip(flow_branches, first_flow_names))
+    flow_config_tree = "\n".join(f"│   │   {branch} {name}.json" for branch, name in zip(flow_branches, first_flow_names))
+    
+    # Build cells: the first flow prepares the data, the last analyzes it, any others process it
+    flow_roles = ["processes the prepared data."] * len(first_flow_names)
+    flow_roles[-1] = "analyzes and summarizes the results."
+    flow_roles[0] = f"prepares the initial data for {domain_lower}."
+    build_flow_cells = "\n".join(f"""# %% [markdown]
+# ## {title}
+#
+# {title} {role}
+
+# %%
+# Initialize flow-specific config
+flow_config = {{**config}}
+flow_config['_flow_name'] = '{name}'
+
+# Execute flow
+start_time = datetime.now()
+run_notebook(
+    notebook_file=flows_dir / '{name}.py',
+    config=flow_config,
+    execution_dir=run_folder / 'execution' / '{name}',
+    project_root=project_root,
+    export_html=True
+)
+duration = (datetime.now() - start_time).total_seconds()
+logger.info(f"✅ Flow completed: {name} | Duration: {{duration:.1f}}s")
+""" for name, title, role in zip(first_flow_names, flow_titles, flow_roles))
+    
     # Get the first scenario dimension for examples
-    first_dimension_name = list(scenario_dimensions.keys())[0]
+    first_dimension_name = next(iter(scenario_dimensions))
     first_dimension_values = scenario_dimensions[first_dimension_name]
     
     # Build scenario config list for conductor (avoid nested f-strings)
     scenario_config_list = ', '.join([f'{{"value": "{val}", "label": "{val.title()}"}}' for val in first_dimension_values])
     
     # Build directory structure for scenario examples (show up to 3, or all if fewer)
-    scenario_dir_lines = []
-    num_to_show = min(3, len(first_dimension_values))
-    for i, val in enumerate(first_dimension_values[:num_to_show]):
-        if i < num_to_show - 1 or len(first_dimension_values) <= 3:
-            scenario_dir_lines.append(f"        ├── {val}/")
-        else:
-            scenario_dir_lines.append(f"        └── {val}/")
+    scenario_dir_lines = [f"        ├── {val}/" for val in first_dimension_values[:3]]
     if len(first_dimension_values) > 3:
+        scenario_dir_lines[-1] = f"        └── {first_dimension_values[2]}/"
         scenario_dir_lines.append(f"        └── ... ({len(first_dimension_values)} total scenarios)")
     scenario_dir_structure = "\n".join(scenario_dir_lines) if scenario_dir_lines else f"        └── {first_dimension_values[0]}/"
     
     guide = f"""# {project_name} - ductaflow Implementation Guide
 
 **Domain**: {domain}  
-**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Generated**: {generated_at}
 
 {description}
 
@@ -107,37 +231,31 @@ Welcome! This guide will walk you through implementing {project_name} using duct
 **Stop thinking in terms of complex DAGs and orchestration tools.** Instead:
 
 - **Flows** are atomic processing steps (`.py` files that work as both scripts and notebooks)
-{f'- **Builds** orchestrate multiple flows in sequence' if explain_build_level else ''}
-- **Conductor** runs flows{f' (via builds)' if explain_build_level else ''} across scenario dimensions
+{builds_bullet}
+- **Conductor** runs flows{via_builds} across scenario dimensions
 - **Filesystem paths** encode dependencies between instances
 
 **The magic**: Every execution creates a complete debugging environment with exact configs, logs, and intermediate files.
 
-{f'**Note**: This guide explains the full build/flow hierarchy. If you prefer a simpler single-level approach, you can skip builds and call flows directly from the conductor. See the CLI usage section below.' if explain_build_level else '**Note**: This guide uses a single-level flow approach. Flows are called directly without an intermediate build layer. You can also call flows individually via CLI using their default config files.'}
+{level_note}
 
 ## Project Structure You Need to Create
 
 ```
 {project_name.lower()}/
 ├── flows/                          # Atomic processing steps
-│   ├── {first_flow_names[0]}.py
-│   ├── {first_flow_names[1]}.py
-│   └── {first_flow_names[2]}.py
-{f'├── builds/                         # Orchestration of flows' if explain_build_level else ''}
-{f'│   └── {first_build_name}.py' if explain_build_level else ''}
+{flow_file_tree}
+{builds_dir_tree}
 ├── config/                         # JSON configurations
 │   ├── flows/
-│   │   ├── {first_flow_names[0]}.json
-│   │   ├── {first_flow_names[1]}.json
-│   │   └── {first_flow_names[2]}.json
-{f'│   └── builds/' if explain_build_level else '│'}
-{f'│       └── {first_build_name}.json' if explain_build_level else ''}
+{flow_config_tree}
+{builds_config_tree}
 ├── conductor.py                    # Multi-scenario orchestrator
 ├── session_outputs/               # Conductor daily logs + checkpoints
 │   ├── conductor_YYYYMMDD.txt     # Daily log file
 │   └── conductor_YYYYMMDD_HHMMSS_*.ipynb  # Optional checkpoints
 └── runs/                          # All execution results
-    └── {first_build_name if explain_build_level and first_build_name else 'scenario_name'}/
+    └── {runs_root_name}/
 {scenario_dir_structure}
 ```
 
@@ -152,19 +270,12 @@ Create `flows/{first_flow_names[0]}.py`:
 config = {{}}
 
 # %% [markdown]
-# # {first_flow_names[0].replace('_', ' ').title()}
+# # {flow_titles[0]}
 #
-# Atomic flow for {domain.lower()} processing.
+# Atomic flow for {domain_lower} processing.
 
 # %%
-# Ductaflow mandatory header
-{import_statement}
-if not is_notebook_execution(): # CLI mode only
-    config = load_cli_config('config/flows/{first_flow_names[0]}.json', '{first_flow_names[0].replace("_", " ").title()}')
-# Standardized config unpacking - ductaflow fundamental
-vars().update(unpack_config(config, "{first_flow_names[0].replace('_', ' ').title()}", locals()))
-# Display config summary for notebook instances
-display_config_summary(config, "{first_flow_names[0].replace('_', ' ').title()}")
+{flow_header}
 
 # %%
 import pandas as pd
@@ -185,7 +296,7 @@ logger.info("📊 Starting {first_flow_names[0].replace('_', ' ')}...")
 # processed_df = your_domain_processing(df)
 # processed_df.to_csv("processed_data.csv", index=False)
 
-logger.info(f"✅ {first_flow_names[0].replace('_', ' ').title()} completed")
+logger.info(f"✅ {flow_titles[0]} completed")
 
 # %%
 ```
@@ -224,7 +335,7 @@ run_step_flow(
 )
 ```
 
-{f'### 4. Build the Complete Build' if explain_build_level else '### 4. Create the Conductor (Single-Level Flow Approach)'}
+{step_4_heading}
 
 {f'Create `builds/{first_build_name}.py`:' if explain_build_level else f'''Since we are using a single-level approach, we will create a conductor that calls flows directly. Create `conductor.py`:
 
@@ -241,19 +352,12 @@ This makes it easy to experiment with different scenario combinations, adjust pa
 config = {{}}
 
 # %% [markdown]
-# # {first_build_name.replace('_', ' ').title()}
+# # {build_title}
 #
-# Orchestrates multiple flows for {domain.lower()}.
+# Orchestrates multiple flows for {domain_lower}.
 
 # %%
-# Ductaflow mandatory header
-{import_statement}
-if not is_notebook_execution(): # CLI mode only
-    config = load_cli_config('config/builds/{first_build_name}.json', '{first_build_name.replace("_", " ").title()}')
-# Standardized config unpacking - ductaflow fundamental
-vars().update(unpack_config(config, "{first_build_name.replace('_', ' ').title()}", locals()))
-# Display config summary for notebook instances
-display_config_summary(config, "{first_build_name.replace('_', ' ').title()}")
+{build_header}
 
 # %%
 from pathlib import Path
@@ -278,72 +382,7 @@ logger.info("Flows directory: {{flows_dir}}".format(flows_dir=flows_dir))
 logger.info("Run folder: {{run_folder}}".format(run_folder=run_folder))
 logger.info("=" * 60)
 
-# %% [markdown]
-# ## {first_flow_names[0].replace('_', ' ').title()}
-#
-# {first_flow_names[0].replace('_', ' ').title()} prepares the initial data for {domain.lower()}.
-
-# %%
-# Initialize flow-specific config
-flow_config = {{**config}}
-flow_config['_flow_name'] = '{first_flow_names[0]}'
-
-# Execute flow
-start_time = datetime.now()
-run_notebook(
-    notebook_file=flows_dir / '{first_flow_names[0]}.py',
-    config=flow_config,
-    execution_dir=run_folder / 'execution' / '{first_flow_names[0]}',
-    project_root=project_root,
-    export_html=True
-)
-duration = (datetime.now() - start_time).total_seconds()
-logger.info(f"✅ Flow completed: {first_flow_names[0]} | Duration: {{duration:.1f}}s")
-
-# %% [markdown]
-# ## {first_flow_names[1].replace('_', ' ').title()}
-#
-# {first_flow_names[1].replace('_', ' ').title()} processes the prepared data.
-
-# %%
-# Initialize flow-specific config
-flow_config = {{**config}}
-flow_config['_flow_name'] = '{first_flow_names[1]}'
-
-# Execute flow
-start_time = datetime.now()
-run_notebook(
-    notebook_file=flows_dir / '{first_flow_names[1]}.py',
-    config=flow_config,
-    execution_dir=run_folder / 'execution' / '{first_flow_names[1]}',
-    project_root=project_root,
-    export_html=True
-)
-duration = (datetime.now() - start_time).total_seconds()
-logger.info(f"✅ Flow completed: {first_flow_names[1]} | Duration: {{duration:.1f}}s")
-
-# %% [markdown]
-# ## {first_flow_names[2].replace('_', ' ').title()}
-#
-# {first_flow_names[2].replace('_', ' ').title()} analyzes and summarizes the results.
-
-# %%
-# Initialize flow-specific config
-flow_config = {{**config}}
-flow_config['_flow_name'] = '{first_flow_names[2]}'
-
-# Execute flow
-start_time = datetime.now()
-run_notebook(
-    notebook_file=flows_dir / '{first_flow_names[2]}.py',
-    config=flow_config,
-    execution_dir=run_folder / 'execution' / '{first_flow_names[2]}',
-    project_root=project_root,
-    export_html=True
-)
-duration = (datetime.now() - start_time).total_seconds()
-logger.info(f"✅ Flow completed: {first_flow_names[2]} | Duration: {{duration:.1f}}s")
-
+{build_flow_cells}
 # %%
     logger.info("{{first_build_name.replace('_', ' ').title()}} completed successfully!")
 
@@ -595,14 +634,7 @@ Every flow MUST have this mandatory header:
 config = {{}}
 
 # %%
-# Ductaflow mandatory header
-{import_statement}
-if not is_notebook_execution(): # CLI mode only
-    config = load_cli_config('config/flows/my_flow.json', 'My Flow')
-# Standardized config unpacking - ductaflow fundamental
-vars().update(unpack_config(config, "My Flow Name", locals()))
-# Display config summary for notebook instances
-display_config_summary(config, "My Flow Name")
+{example_header}
 
 # %%
 import pandas as pd
@@ -856,30 +888,53 @@ Good luck building {project_name}! 🚀
 
 ---
 
-*This guide was generated by `generate_project_guide.py` on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
+*This guide was generated by `generate_project_guide.py` on {generated_at}*
 """
 
     return guide
 
 def main():
-    """Main function to generate project guide."""
-    config_file = sys.argv[1] if len(sys.argv) > 1 else "project_config.json"
-    
-    print(f"🚀 Generating project guide from {config_file}...")
+    """Main function to generate project guide(s)."""
+    parser = argparse.ArgumentParser(description="Generate a ductaflow HOW TO guide from a project config")
+    parser.add_argument("config_files", nargs="*", default=["project_config.json"], metavar="config_file",
+                        help="Project config JSON(s) - one guide each, in one process (default: project_config.json)")
+    parser.add_argument("-o", "--output", help="Output file (default: {project_name}_HOWTO.md; single config only)")
+    parser.add_argument("--stdout", action="store_true",
+                        help="Write the guide(s) to stdout instead of files (for piping)")
+    args = parser.parse_args()
+    if args.output and len(args.config_files) > 1:
+        parser.error("-o/--output can only be used with a single config file")
     
-    config = load_project_config(config_file)
-    guide = generate_project_guide(config)
+    # With --stdout the guide owns stdout, so progress messages go to stderr
+    log = sys.stderr if args.stdout else sys.stdout
     
-    output_file = f"{config['project_name']}_HOWTO.md"
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(guide)
-    
-    print(f"✅ Generated: {output_file}")
-    print(f"📊 Project: {config['project_name']}")
-    print(f"🏗️ Build: {config['first_build_name']}")
-    print(f"🔄 Flows: {', '.join(config['first_flow_names'])}")
-    print(f"📋 Scenarios: {list(config['scenario_dimensions'].keys())[0]} = {config['scenario_dimensions'][list(config['scenario_dimensions'].keys())[0]]}")
+    for config_file in args.config_files:
+        print(f"🚀 Generating project guide from {config_file}...", file=log)
+        
+        config = load_project_config(config_file)
+        try:
+            validate_project_config(config)
+        except ValueError as e:
+            print(f"❌ {config_file}: {e}", file=sys.stderr)
+            sys.exit(1)
+        guide = generate_project_guide(config)
+        
+        if args.stdout:
+            sys.stdout.buffer.write(guide.encode('utf-8'))
+            sys.stdout.flush()
+            output_file = "<stdout>"
+        else:
+            output_file = args.output or f"{config['project_name']}_HOWTO.md"
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(guide)
+        
+        print(f"✅ Generated: {output_file}", file=log)
+        print(f"📊 Project: {config['project_name']}", file=log)
+        print(f"🏗️ Build: {config.get('first_build_name', '')}", file=log)
+        print(f"🔄 Flows: {', '.join(config['first_flow_names'])}", file=log)
+        scenario_dimensions = config['scenario_dimensions']
+        first_dimension_name = next(iter(scenario_dimensions))
+        print(f"📋 Scenarios: {first_dimension_name} = {scenario_dimensions[first_dimension_name]}", file=log)
 
 if __name__ == "__main__":
     main()
@@ -6,128 +6,417 @@ This shows how anti-notebook users can orchestrate ductaflow pipelines
 using pure Python scripts and the CLI mode of flows.
 """
 
+import argparse
+import functools
+import hashlib
+import io
+import logging
+import multiprocessing
 import subprocess
-import pandas as pd
 import json
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
+# Shared with ductaflow's own config persistence, so both decide the orjson/stdlib split alike
+from ductaflow.ductaflow import _needs_stdlib_json
 
-def run_flow_as_script(flow_path, step_name, instance_name, config):
+try:
+    import orjson  # Optional: faster config serialization
+except ImportError:
+    orjson = None
+
+
+# One record per event, so lines from parallel workers never interleave mid-message
+log = logging.getLogger("pure_conductor")
+
+
+def _configure_logging():
+    """Console logging for the conductor (also run in each pool worker)"""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+
+# Compiled flow code per flow path - each pool worker compiles a flow once
+_FLOW_CACHE = {}
+
+
+def _load_flow(flow_path):
+    """Compile a flow file once per process and reuse the code object"""
+    code = _FLOW_CACHE.get(flow_path)
+    if code is None:
+        source = Path(flow_path).read_text(encoding='utf-8')
+        code = _FLOW_CACHE[flow_path] = compile(source, flow_path, 'exec')
+    return code
+
+
+def run_flow_in_process(flow_path, payload, cwd=None):
     """
-    Run a ductaflow .py file as a pure Python script
+    Run a ductaflow .py file in this interpreter instead of a new python
     
-    Uses the if __name__ == "__main__" CLI mode built into flows
+    Executes the flow exactly as its CLI mode would (as __main__ with
+    --config-stdin, reading the JSON payload bytes from stdin), skipping
+    the interpreter start-up a subprocess pays per call.
+    The flow runs in cwd (default: the current working directory); flows
+    rely on relative paths, so this changes the process-wide cwd for the
+    duration of the call - use one process per concurrent flow.
     """
-    # Create step-based directory structure
+    code = _load_flow(flow_path)
+    original_argv, original_stdin = sys.argv, sys.stdin
+    original_cwd = os.getcwd() if cwd is not None else None
+    sys.argv = [flow_path, '--config-stdin']
+    sys.stdin = io.TextIOWrapper(io.BytesIO(payload), encoding='utf-8')
+    try:
+        if cwd is not None:
+            os.chdir(cwd)
+        exec(code, {'__name__': '__main__', '__file__': flow_path})
+    except SystemExit as e:
+        # Mirror a subprocess: exit(0)/exit() is success, anything else fails
+        if e.code not in (None, 0):
+            raise RuntimeError(f"{flow_path} exited with {e.code!r}") from e
+    finally:
+        sys.argv, sys.stdin = original_argv, original_stdin
+        if original_cwd is not None:
+            os.chdir(original_cwd)
+
+
+# One marker per output directory, holding the cache key of the run that produced it
+_SUCCESS_MARKER = ".success"
+
+
+def _read_marker(output_dir):
+    """Cache key recorded by the last successful run in output_dir, or None"""
+    try:
+        return (output_dir / _SUCCESS_MARKER).read_text(encoding='utf-8').strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def _cache_key(flow_path, payload, upstream=()):
+    """
+    Cache key for running this flow source with this config on these inputs
+    
+    Keyed on the flow's bytes, the serialized config payload (exactly what the
+    flow receives) and the marker keys of every upstream output directory, so a
+    change to any of them invalidates the cached result. Returns None (never
+    cached) when an upstream directory has no successful run recorded.
+    """
+    key = hashlib.sha256(Path(flow_path).read_bytes())
+    key.update(payload)
+    for upstream_dir in upstream:
+        upstream_key = _read_marker(Path(upstream_dir))
+        if upstream_key is None:
+            return None
+        key.update(f"\0{upstream_key}".encode('utf-8'))
+    return key.hexdigest()
+
+
+def _prepare_layout(step_name, instance_names):
+    """Create runs/<step_name>/<instance> for every instance in one pass"""
     step_dir = Path("runs") / step_name
     step_dir.mkdir(parents=True, exist_ok=True)
+    for instance_name in instance_names:
+        (step_dir / instance_name).mkdir(exist_ok=True)
+    get_available_instances.cache_clear()
+
+
+def _dumps_config(config):
+    """
+    Serialize a config to compact JSON bytes (flows parse it, nobody reads it)
+    
+    Non-JSON values (datetimes, Enums, dataclasses, ...) raise TypeError whether
+    or not orjson is installed; orjson only encodes what json.dumps would.
+    """
+    if orjson is not None and not _needs_stdlib_json(config):
+        try:
+            return orjson.dumps(config, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        except orjson.JSONEncodeError:
+            pass  # e.g. big ints or non-JSON values - let the stdlib decide (or raise)
+    return json.dumps(config, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _write_bytes(path, payload):
+    """Write payload to path with a single open/write/close"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+
+def _read_tail(path, max_bytes=4096):
+    """Return the last max_bytes of a log file as text"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - max_bytes))
+        return f.read().decode('utf-8', errors='replace')
+
+
+def _write_if_changed(path, payload):
+    """
+    Write payload to path unless the file already holds exactly these bytes
+    
+    Leaving an identical file untouched keeps its mtime stable for make-style
+    tooling. Returns True if the file was written.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == payload:
+                return False
+    except FileNotFoundError:
+        pass
+    _write_bytes(path, payload)
+    return True
+
+
+def run_flow_as_script(flow_path, step_name, instance_name, config, isolated=False,
+                       persist_config=True, dry_run=False, upstream=()):
+    """
+    Run a ductaflow .py file as a pure Python script
     
-    output_dir = step_dir / instance_name
-    output_dir.mkdir(parents=True, exist_ok=True)
+    Uses the if __name__ == "__main__" CLI mode built into flows. flow_path
+    must be absolute (resolve it once per flow, not per instance). By default
+    the flow runs in-process (see run_flow_in_process); pass isolated=True
+    to run it in a separate python subprocess instead.
+    
+    The config reaches the flow on stdin (--config-stdin), so the flow never
+    re-reads it from disk; config.json is still written for the record unless
+    persist_config=False. With dry_run=True the config is written and the
+    flow is not run.
+    
+    A run is skipped when the output directory's success marker records the
+    same flow source, config and upstream results (upstream: output directories
+    this step reads); set DUCTAFLOW_NO_CACHE=1 to always run.
+    """
+    assert Path(flow_path).is_absolute(), f"flow_path must be absolute: {flow_path}"
     
-    # Save config file for the flow to read
+    # Step-based directory structure - normally created up front by _prepare_layout
+    output_dir = Path("runs") / step_name / instance_name
     config_path = output_dir / "config.json"
-    with open(config_path, 'w') as f:
-        json.dump(config, f, indent=2)
+    payload = _dumps_config(config)
     
-    print(f"🚀 Executing Step: {step_name}")
-    print(f"📋 Instance: {instance_name}")
-    print(f"📁 Output: {output_dir}")
+    # Save config file alongside the outputs for reproducibility
+    if persist_config or dry_run:
+        try:
+            _write_if_changed(config_path, payload)
+        except FileNotFoundError:
+            _prepare_layout(step_name, [instance_name])
+            _write_bytes(config_path, payload)
+    elif not output_dir.is_dir():
+        _prepare_layout(step_name, [instance_name])
     
-    # Change to output directory and run flow as script
-    original_cwd = os.getcwd()
+    if dry_run:
+        log.info("📝 Dry run: wrote %s", config_path)
+        return output_dir
+    
+    key = _cache_key(flow_path, payload, upstream)
+    if (key is not None and os.environ.get('DUCTAFLOW_NO_CACHE', '0') in ('', '0')
+            and _read_marker(output_dir) == key):
+        log.info("⏭️ Cached: %s/%s (unchanged flow, config and inputs)", step_name, instance_name)
+        return output_dir
+    
+    # Outputs are about to change - drop the old marker so a failed run is never cached
+    marker = output_dir / _SUCCESS_MARKER
     try:
-        os.chdir(output_dir)
-        
-        # Run the flow as a Python script with config
-        result = subprocess.run([
-            'python', 
-            str(Path(original_cwd) / flow_path),
-            '--config', 
-            str(config_path)
-        ], check=True, capture_output=True, text=True)
+        marker.unlink()
+    except FileNotFoundError:
+        pass
+    
+    log.info("🚀 Executing: %s/%s -> %s", step_name, instance_name, output_dir)
+    
+    # Run the flow inside output_dir; only the flow sees that cwd, not this process
+    try:
+        if isolated:
+            # Run the flow as a Python script with config - its output goes
+            # straight to log files rather than through pipes into this process
+            with open(output_dir / "stdout.log", 'wb') as out, \
+                 open(output_dir / "stderr.log", 'wb') as err:
+                subprocess.run([
+                    sys.executable,  # same interpreter, and no PATH lookup per launch
+                    flow_path,
+                    '--config-stdin'
+                ], input=payload, check=True, stdout=out, stderr=err, cwd=output_dir)
+        else:
+            run_flow_in_process(flow_path, payload, cwd=output_dir)
         
-        print(f"✅ Completed: {step_name}/{instance_name}")
-        print(f"📄 Output: {result.stdout}")
+        log.info("✅ Completed: %s/%s", step_name, instance_name)
+        if key is not None:
+            marker.write_text(key, encoding='utf-8')
         
         return output_dir
         
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed: {step_name}/{instance_name}")
-        print(f"Error: {e.stderr}")
+    except subprocess.CalledProcessError:
+        log.error("❌ Failed: %s/%s - tail of %s:\n%s", step_name, instance_name,
+                  output_dir / 'stderr.log', _read_tail(output_dir / 'stderr.log'))
+        raise
+    except Exception as e:
+        log.error("❌ Failed: %s/%s - %s", step_name, instance_name, e)
         raise
-    finally:
-        os.chdir(original_cwd)
 
 
+def _run_prep(row, flow_path, dry_run=False):
+    """Run the data preparation step for one control row (pool worker)"""
+    config = {
+        'data_source': f"data/{row['instance_name']}.csv",
+        'param1': row['param1'],
+        'param2': row['param2'],
+        'processing_params': {
+            'method': 'standard',
+            'iterations': 100
+        }
+    }
+    
+    return run_flow_as_script(
+        flow_path=flow_path,
+        step_name="data_prep",
+        instance_name=row['instance_name'],
+        config=config,
+        dry_run=dry_run
+    )
+
+
+def _run_analysis(instance, flow_path, dry_run=False):
+    """Run the dependent analysis step for one prep instance (pool worker)"""
+    analysis_config = {
+        'prep_instance': instance,
+        'analysis_type': 'full',
+        'output_format': 'html'
+    }
+    
+    return run_flow_as_script(
+        flow_path=flow_path,
+        step_name="analysis",
+        instance_name=instance,
+        config=analysis_config,
+        dry_run=dry_run,
+        upstream=[Path("runs") / "data_prep" / instance]
+    )
+
+
+# Heavy imports done once in the forkserver so every worker forks already warm
+# (modules that are not installed are skipped by the forkserver)
+_PRELOAD_MODULES = ["ductaflow", "numpy", "pandas"]
+
+
+def _pool_context():
+    """
+    Multiprocessing context for the worker pool - a preloaded forkserver where available
+    
+    Set DUCTAFLOW_SPAWN=1 to use plain spawn workers instead (as on Windows),
+    e.g. when a preloaded library misbehaves after fork.
+    """
+    if os.environ.get('DUCTAFLOW_SPAWN', '0') not in ('', '0'):
+        return multiprocessing.get_context('spawn')
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return None  # e.g. Windows: keep the platform default (spawn)
+    ctx = multiprocessing.get_context('forkserver')
+    ctx.set_forkserver_preload(_PRELOAD_MODULES)
+    return ctx
+
+
+def _run_pipeline(rows, prep_flow, analysis_flow, max_workers=None):
+    """
+    Stream each control row through data_prep -> analysis on a process pool
+    
+    An instance's analysis is submitted as soon as its own data_prep finishes,
+    so the two steps overlap instead of waiting on a barrier between them.
+    Each worker has its own cwd, so in-process flows can safely chdir.
+    Workers are forked from a forkserver with _PRELOAD_MODULES already
+    imported, so the flows' heavy imports are paid once, not per worker.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                             mp_context=_pool_context(),
+                             initializer=_configure_logging) as ex:
+        prep_futures = {ex.submit(_run_prep, row, prep_flow): row['instance_name'] for row in rows}
+        analysis_futures = []
+        for future in as_completed(prep_futures):
+            future.result()
+            analysis_futures.append(ex.submit(_run_analysis, prep_futures[future], analysis_flow))
+        for future in as_completed(analysis_futures):
+            future.result()
+
+
+@functools.lru_cache(maxsize=None)
 def get_available_instances(step_name):
-    """Get available instances for a given step"""
+    """
+    Get available instances for a given step
+    
+    Listings are cached per step; _prepare_layout clears the cache whenever
+    it creates instance directories. Orchestrators that already know the
+    instance names they submitted should pass those along instead.
+    """
     step_dir = Path("runs") / step_name
-    if not step_dir.exists():
-        return []
-    return [d.name for d in step_dir.iterdir() if d.is_dir()]
+    try:
+        # scandir reports the entry type from the directory listing - no stat per entry
+        with os.scandir(step_dir) as entries:
+            return tuple(e.name for e in entries if e.is_dir(follow_symlinks=False))
+    except FileNotFoundError:
+        return ()
+
+
+def _write_plan(rows, prep_flow, analysis_flow):
+    """
+    Dry run: write every instance's config.json without running any flow
+    
+    Also writes runs/plan.json listing each (step, instance, config_path) so the
+    planned config tree can be reviewed or diffed in CI.
+    """
+    plan = []
+    for row in rows:
+        instance = row['instance_name']
+        for step_name, output_dir in (
+            ("data_prep", _run_prep(row, prep_flow, dry_run=True)),
+            ("analysis", _run_analysis(instance, analysis_flow, dry_run=True)),
+        ):
+            plan.append({'step': step_name, 'instance': instance,
+                         'config_path': (output_dir / "config.json").as_posix()})
+    
+    plan_path = Path("runs") / "plan.json"
+    plan_path.write_text(json.dumps(plan, indent=2) + "\n", encoding='utf-8')
+    return plan_path
 
 
-def main():
+def main(argv=None):
     """
     Example orchestration using pure Python + CLI flows
     
     This replicates conductor.py functionality without any notebooks
     """
-    print("🐍 Pure Python Conductor - No Notebooks!")
-    print(f"🕐 Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Write every config.json and runs/plan.json, but run no flows')
+    args = parser.parse_args(argv)
+    
+    _configure_logging()
+    log.info("🐍 Pure Python Conductor - No Notebooks! Started %s",
+             datetime.now().isoformat(timespec='seconds'))
     
-    # Example: Load control dataframe (like conductor.py does)
+    # Example: control rows, one per scenario instance
     control_data = [
         {'instance_name': 'scenario_A', 'param1': 100, 'param2': 'mode_A'},
         {'instance_name': 'scenario_B', 'param1': 200, 'param2': 'mode_B'},
         {'instance_name': 'scenario_C', 'param1': 150, 'param2': 'mode_A'},
     ]
-    control_df = pd.DataFrame(control_data)
-    
-    print(f"📊 Processing {len(control_df)} scenarios")
-    
-    # Step 1: Run data preparation for each scenario
-    for _, row in control_df.iterrows():
-        config = {
-            'data_source': f"data/{row['instance_name']}.csv",
-            'param1': row['param1'],
-            'param2': row['param2'],
-            'processing_params': {
-                'method': 'standard',
-                'iterations': 100
-            }
-        }
-        
-        run_flow_as_script(
-            flow_path="flow/_flow_shell.py",  # Your actual flow
-            step_name="data_prep",
-            instance_name=row['instance_name'],
-            config=config
-        )
-    
-    # Step 2: Chain dependent analysis step
-    prep_instances = get_available_instances("data_prep")
-    print(f"🔗 Found {len(prep_instances)} prep instances for analysis")
-    
-    for instance in prep_instances:
-        analysis_config = {
-            'prep_instance': instance,
-            'analysis_type': 'full',
-            'output_format': 'html'
-        }
-        
-        run_flow_as_script(
-            flow_path="flow/_flow_shell.py",  # Your analysis flow
-            step_name="analysis",
-            instance_name=instance,
-            config=analysis_config
-        )
-    
-    print("✅ Pure Python orchestration complete!")
-    print(f"📁 Results in: runs/")
+    log.info("📊 Processing %d scenarios", len(control_data))
+    
+    # Flow paths are resolved once here and shared by every instance
+    prep_flow = str(Path("flow/_flow_shell.py").resolve())  # Your actual flow
+    analysis_flow = str(Path("flow/_flow_shell.py").resolve())  # Your analysis flow
+    
+    instance_names = [row['instance_name'] for row in control_data]
+    for step_name in ("data_prep", "analysis"):
+        _prepare_layout(step_name, instance_names)
+    
+    if args.dry_run:
+        plan_path = _write_plan(control_data, prep_flow, analysis_flow)
+        log.info("📝 Dry run complete - no flows executed. Plan: %s", plan_path)
+        return
+    
+    # Step 1 feeds step 2 per instance: analysis starts as soon as its prep is done
+    _run_pipeline(control_data, prep_flow, analysis_flow)
+    
+    log.info("✅ Pure Python orchestration complete! Results in: runs/")
 
 
 if __name__ == "__main__":
@@ -39,11 +39,12 @@ setup(
     install_requires=[
         "papermill>=2.3.0",
         "jupytext>=1.13.0",
-        "pandas>=1.3.0",
-
     ],
     extras_require={
         "html": ["nbconvert>=6.0.0"],
+        "fast": ["orjson>=3.6.0"],
+        # Dataframe orchestration (conductor.py-style control tables, example flows)
+        "pandas": ["pandas>=1.3.0"],
     },
     include_package_data=True,
     project_urls={
@@ -0,0 +1,62 @@
+"""
+Saved configs must not depend on whether the optional orjson extra is installed.
+"""
+
+import collections
+import dataclasses
+import datetime
+import enum
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import ductaflow.ductaflow as ductaflow_module
+
+
+class Color(enum.Enum):
+    RED = 1
+
+
+@dataclasses.dataclass
+class Settings:
+    a: int
+
+
+Point = collections.namedtuple("Point", "x y")
+
+
+def _dump_with(orjson_module, obj):
+    """Write obj with _dump_json using the given orjson module (None = stdlib) and parse it back."""
+    original = ductaflow_module.orjson
+    ductaflow_module.orjson = orjson_module
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.json"
+            ductaflow_module._dump_json(obj, path)
+            # Canonical form, so NaN/Infinity compare by text
+            return json.dumps(json.loads(path.read_text()), sort_keys=True)
+    finally:
+        ductaflow_module.orjson = original
+
+
+@unittest.skipIf(ductaflow_module.orjson is None, "orjson not installed")
+class DumpJsonBackendTests(unittest.TestCase):
+    CASES = {
+        "enum": {"e": Color.RED},
+        "dataclass": {"d": Settings(a=1)},
+        "datetime": {"t": datetime.datetime(2026, 1, 2, 3, 4, 5), "day": datetime.date(2026, 1, 2)},
+        "namedtuple": {"p": Point(1, 2)},
+        "non_finite": {"nan": float("nan"), "inf": float("inf"), "neg": float("-inf")},
+        "path_and_nesting": {"p": Path("/x"), "l": [1, 2.5, {"k": "é"}], "big": 2 ** 70},
+        "non_str_keys": {1: "x", "nested": {2.5: "y"}},
+    }
+
+    def test_orjson_and_stdlib_save_the_same_values(self):
+        for name, obj in self.CASES.items():
+            with self.subTest(name):
+                self.assertEqual(_dump_with(ductaflow_module.orjson, obj), _dump_with(None, obj))
+
+
+if __name__ == "__main__":
+    unittest.main()